@@ -18,31 +18,52 @@ from . import operators
 from . import panels
 from . import properties
 
-classes = [
+classes = (
     properties.SpiderShotProperties,
     properties.SpiderSpreadProperties, 
     properties.SpiderWebProperties,
     operators.MESH_OT_create_spider_web_from_coords,
-    operators.MESH_OT_update_spider_web_position,
-    operators.MESH_OT_update_spider_web_selected,
+    operators.MESH_OT_update_spider_web,
     operators.MESH_OT_set_target_from_cursor,
     operators.MESH_OT_set_origin_from_cursor,
     panels.VIEW3D_PT_spider_web_panel,
     panels.SPIDER_WEB_OT_load_config,
     panels.SPIDER_WEB_OT_save_config,
-]
+)
 
 def register():
     for cls in classes:
-        bpy.utils.register_class(cls)
+        # Skip classes still registered from a previous enable (e.g. after a failed unregister)
+        if not cls.is_registered:
+            bpy.utils.register_class(cls)
     
     bpy.types.Scene.spider_web_props = PointerProperty(type=properties.SpiderWebProperties)
+    
+    # Files saved before origin and target became vector properties store separate x/y/z values.
+    # The file already open when the addon is enabled gets no load_post, and bpy.data can't be
+    # written during registration, so migrate it from a timer right after
+    if properties.migrate_legacy_coordinates not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(properties.migrate_legacy_coordinates)
+    if not bpy.app.timers.is_registered(properties.migrate_legacy_coordinates):
+        bpy.app.timers.register(properties.migrate_legacy_coordinates, first_interval=0)
+    
+    # Pointers from the previous file mean nothing in the next one
+    if operators.clear_config_cache not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(operators.clear_config_cache)
 
 def unregister():
+    if bpy.app.timers.is_registered(properties.migrate_legacy_coordinates):
+        bpy.app.timers.unregister(properties.migrate_legacy_coordinates)
+    if properties.migrate_legacy_coordinates in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(properties.migrate_legacy_coordinates)
+    if operators.clear_config_cache in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(operators.clear_config_cache)
+    
     del bpy.types.Scene.spider_web_props
     
     for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+        if cls.is_registered:
+            bpy.utils.unregister_class(cls)
 
 if __name__ == "__main__":
     register()
\ No newline at end of file
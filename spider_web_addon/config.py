@@ -1,11 +1,11 @@
 import bpy
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, asdict
 from typing import Tuple, Optional
 
 @dataclass
 class SpiderShotConfig:
     shoot_time: float = 1.0
-    is_target_parent: float = False
+    is_target_parent: bool = False
     is_tethered: bool = True
     
     # Tether specific properties
@@ -46,4 +46,20 @@ class SpiderWebConfig:
     spider_shot_config: SpiderShotConfig = field(default_factory=SpiderShotConfig)
     spider_spread_config: SpiderSpreadConfig = field(default_factory=SpiderSpreadConfig)
     animate_web: bool = True
-    start_frame: int = 1
\ No newline at end of file
+    start_frame: int = 1
+    
+    def to_dict(self):
+        """Convert the whole config, including sub-configs, to a plain dict"""
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Build a config from to_dict() output; unknown keys are ignored and missing ones keep their defaults"""
+        def build(config_cls, values):
+            names = {f.name for f in fields(config_cls)}
+            return config_cls(**{key: value for key, value in values.items() if key in names})
+        
+        config = build(cls, {key: value for key, value in data.items() if not key.endswith("_config")})
+        config.spider_shot_config = build(SpiderShotConfig, data.get("spider_shot_config", {}))
+        config.spider_spread_config = build(SpiderSpreadConfig, data.get("spider_spread_config", {}))
+        return config
\ No newline at end of file
@@ -1,194 +1,138 @@
 import bpy
 
-def create_web_curve_node_tree(name="WebCurveNodeTree"):
-    """Create the geometry node tree for web curves"""
-    
-    # Create new node tree
-    node_tree = bpy.data.node_groups.new(name, 'GeometryNodeTree')
-    
-    # Create input and output nodes
-    input_node = node_tree.nodes.new('NodeGroupInput')
-    output_node = node_tree.nodes.new('NodeGroupOutput')
-    
-    # Position input/output nodes
-    input_node.location = (-800, 0)
-    output_node.location = (600, 0)
-    
-    # Create node tree interface in the correct order
-    # Input sockets
-    web_center_input = node_tree.interface.new_socket(name="Web Center", socket_type='NodeSocketObject', in_out='INPUT')
-    web_spoke_input = node_tree.interface.new_socket(name="Web Spoke", socket_type='NodeSocketObject', in_out='INPUT')  
-    web_origin_input = node_tree.interface.new_socket(name="Web Origin", socket_type='NodeSocketObject', in_out='INPUT')
-    profile_radius_input = node_tree.interface.new_socket(name="Profile Radius", socket_type='NodeSocketFloat', in_out='INPUT')
-    curve_resolution_input = node_tree.interface.new_socket(name="Curve Resolution", socket_type='NodeSocketInt', in_out='INPUT')
-    curve_amount_input = node_tree.interface.new_socket(name="Curve Amount", socket_type="NodeSocketFloat", in_out='INPUT')
-    
-    # Set default values
-    profile_radius_input.default_value = 0.01
-    curve_resolution_input.default_value = 30
-    curve_amount_input.default_value = 0.1
-    
-    # Output socket
-    geometry_output = node_tree.interface.new_socket(name="Geometry", socket_type='NodeSocketGeometry', in_out='OUTPUT')
-    
-    # Create Object Info nodes
-    obj_info_center = node_tree.nodes.new('GeometryNodeObjectInfo')
-    obj_info_center.name = "Object Info Center"
-    obj_info_center.location = (-600, 200)
-    obj_info_center.transform_space = 'RELATIVE'
-    
-    obj_info_spoke = node_tree.nodes.new('GeometryNodeObjectInfo')
-    obj_info_spoke.name = "Object Info Spoke"
-    obj_info_spoke.location = (-600, 0)
-    obj_info_spoke.transform_space = 'RELATIVE'
-    
-    obj_info_origin = node_tree.nodes.new('GeometryNodeObjectInfo')
-    obj_info_origin.name = "Object Info Origin"
-    obj_info_origin.location = (-600, -200)
-    obj_info_origin.transform_space = 'RELATIVE'
-    
-    # Create Curve Line node
-    curve_line = node_tree.nodes.new('GeometryNodeCurvePrimitiveLine')
-    curve_line.location = (-400, 100)
-    curve_line.inputs['Start'].default_value = (0, 0, 0)
-    curve_line.inputs['End'].default_value = (0, 0, 1)
-    
-    # Create Resample Curve node
-    resample_curve = node_tree.nodes.new('GeometryNodeResampleCurve')
-    resample_curve.location = (-200, 100)
-    resample_curve.mode = 'COUNT'
+# Interface sockets in order as (name, socket type, in/out, default value or None)
+_INTERFACE_SPEC = (
+    ("Web Center", 'NodeSocketObject', 'INPUT', None),
+    ("Web Spoke", 'NodeSocketObject', 'INPUT', None),
+    ("Web Origin", 'NodeSocketObject', 'INPUT', None),
+    ("Profile Radius", 'NodeSocketFloat', 'INPUT', 0.01),
+    ("Curve Resolution", 'NodeSocketInt', 'INPUT', 30),
+    ("Curve Amount", 'NodeSocketFloat', 'INPUT', 0.1),
+    ("Geometry", 'NodeSocketGeometry', 'OUTPUT', None),
+)
 
-    # Create Spline Parameter node
-    spline_param = node_tree.nodes.new('GeometryNodeSplineParameter')
-    spline_param.location = (-200, -100)
-    
-    # Create Math nodes for the complex curve calculation
-    math_005 = node_tree.nodes.new('ShaderNodeMath')
-    math_005.name = "Math.005"
-    math_005.location = (0, -50)
-    math_005.operation = 'POWER'
-    math_005.inputs[1].default_value = 2.0
-    
-    math_006 = node_tree.nodes.new('ShaderNodeMath')
-    math_006.name = "Math.006"
-    math_006.location = (0, -150)
-    math_006.operation = 'SUBTRACT'
-    
-    math_007 = node_tree.nodes.new('ShaderNodeMath')
-    math_007.name = "Math.007"
-    math_007.location = (0, -250)
-    math_007.operation = 'MULTIPLY'
-    math_007.inputs[1].default_value = 4.0
-    
-    math_008 = node_tree.nodes.new('ShaderNodeMath')
-    math_008.name = "Math.008"
-    math_008.location = (0, -350)
-    math_008.operation = 'MULTIPLY'
-    
-    # Create Vector Math nodes
-    # Calculate midpoint between start and end
-    vec_math_midpoint = node_tree.nodes.new('ShaderNodeVectorMath')
-    vec_math_midpoint.name = "Vector Math Midpoint"
-    vec_math_midpoint.location = (-400, -200)
-    vec_math_midpoint.operation = 'ADD'
-    
-    vec_math_midpoint_scale = node_tree.nodes.new('ShaderNodeVectorMath')
-    vec_math_midpoint_scale.name = "Vector Math Midpoint Scale"
-    vec_math_midpoint_scale.location = (-200, -200)
-    vec_math_midpoint_scale.operation = 'SCALE'
-    vec_math_midpoint_scale.inputs[3].default_value = -0.5
-    
-    # Calculate direction from midpoint to reference point (WebOrigin)
-    vec_math_direction = node_tree.nodes.new('ShaderNodeVectorMath')
-    vec_math_direction.name = "Vector Math Direction"
-    vec_math_direction.location = (-200, -300)
-    vec_math_direction.operation = 'SUBTRACT'
-    
-    # Normalize the direction
-    vec_math_normalize = node_tree.nodes.new('ShaderNodeVectorMath')
-    vec_math_normalize.name = "Vector Math Normalize"
-    vec_math_normalize.location = (-200, -400)
-    vec_math_normalize.operation = 'NORMALIZE'
-    
-    # Scale by curve amount
-    vec_math_scale_curve = node_tree.nodes.new('ShaderNodeVectorMath')
-    vec_math_scale_curve.name = "Vector Math Scale Curve"
-    vec_math_scale_curve.location = (200, -300)
-    vec_math_scale_curve.operation = 'SCALE'
+# Nodes as (key, type, name, location, attributes, input defaults); name None keeps Blender's default
+_NODE_SPEC = (
+    ('input', 'NodeGroupInput', None, (-800, 0), (), ()),
+    ('output', 'NodeGroupOutput', None, (600, 0), (), ()),
 
-    # Final offset calculation
-    vec_math_final_offset = node_tree.nodes.new('ShaderNodeVectorMath')
-    vec_math_final_offset.name = "Vector Math Final Offset"
-    vec_math_final_offset.location = (200, -400)
-    vec_math_final_offset.operation = 'SCALE'
-    
-    # Create Set Position node
-    set_position = node_tree.nodes.new('GeometryNodeSetPosition')
-    set_position.location = (200, 100)
-    set_position.inputs['Selection'].default_value = True
-    
-    # Create Curve Circle node (profile)
-    curve_circle = node_tree.nodes.new('GeometryNodeCurvePrimitiveCircle')
-    curve_circle.location = (200, 300)
-    curve_circle.mode = 'RADIUS'  # Set mode to radius instead of points
-    curve_circle.inputs['Resolution'].default_value = 16
-    
-    # Create Curve to Mesh node
-    curve_to_mesh = node_tree.nodes.new('GeometryNodeCurveToMesh')
-    curve_to_mesh.location = (400, 200)
-    curve_to_mesh.inputs['Fill Caps'].default_value = True
-    
-    # Link input nodes to Object Info nodes and other inputs
-    node_tree.links.new(input_node.outputs['Web Center'], obj_info_center.inputs['Object'])
-    node_tree.links.new(input_node.outputs['Web Spoke'], obj_info_spoke.inputs['Object'])
-    node_tree.links.new(input_node.outputs['Web Origin'], obj_info_origin.inputs['Object'])
-    node_tree.links.new(input_node.outputs['Profile Radius'], curve_circle.inputs['Radius'])
-    node_tree.links.new(input_node.outputs['Curve Resolution'], resample_curve.inputs['Count'])
-    
-    # Link Object Info to Curve Line
-    node_tree.links.new(obj_info_center.outputs['Location'], curve_line.inputs['Start'])
-    node_tree.links.new(obj_info_spoke.outputs['Location'], curve_line.inputs['End'])
-    
-    # Link curve processing chain
-    node_tree.links.new(curve_line.outputs['Curve'], resample_curve.inputs['Curve'])
-    node_tree.links.new(resample_curve.outputs['Curve'], set_position.inputs['Geometry'])
-    node_tree.links.new(set_position.outputs['Geometry'], curve_to_mesh.inputs['Curve'])
-    
-    # Link profile curve
-    node_tree.links.new(curve_circle.outputs['Curve'], curve_to_mesh.inputs['Profile Curve'])
-    
-    # Link math for curve deformation (parabolic curve)
-    node_tree.links.new(spline_param.outputs['Factor'], math_005.inputs[0])
-    node_tree.links.new(math_005.outputs['Value'], math_006.inputs[0])
-    node_tree.links.new(spline_param.outputs['Factor'], math_006.inputs[1])
-    node_tree.links.new(math_006.outputs['Value'], math_007.inputs[0])
-    node_tree.links.new(math_007.outputs['Value'], math_008.inputs[0])
-    
-    # Link vector math chain for proper curve direction calculation
-    # Calculate midpoint between start and end points
-    node_tree.links.new(obj_info_center.outputs['Location'], vec_math_midpoint.inputs[0])
-    node_tree.links.new(obj_info_spoke.outputs['Location'], vec_math_midpoint.inputs[1])
-    node_tree.links.new(vec_math_midpoint.outputs['Vector'], vec_math_midpoint_scale.inputs[0])
-    
-    # Calculate direction from midpoint to reference point
-    node_tree.links.new(obj_info_origin.outputs['Location'], vec_math_direction.inputs[0])
-    node_tree.links.new(vec_math_midpoint_scale.outputs['Vector'], vec_math_direction.inputs[1])
-    
-    # Normalize the direction
-    node_tree.links.new(vec_math_direction.outputs['Vector'], vec_math_normalize.inputs[0])
+    # Object Info nodes for the strand start, end and curve reference point
+    ('obj_info_center', 'GeometryNodeObjectInfo', "Object Info Center", (-600, 200), (('transform_space', 'RELATIVE'),), ()),
+    ('obj_info_spoke', 'GeometryNodeObjectInfo', "Object Info Spoke", (-600, 0), (('transform_space', 'RELATIVE'),), ()),
+    ('obj_info_origin', 'GeometryNodeObjectInfo', "Object Info Origin", (-600, -200), (('transform_space', 'RELATIVE'),), ()),
+
+    # Straight strand, resampled so it can be bent
+    ('curve_line', 'GeometryNodeCurvePrimitiveLine', None, (-400, 100), (), ()),
+    ('resample_curve', 'GeometryNodeResampleCurve', None, (-200, 100), (('mode', 'COUNT'),), ()),
+    ('spline_param', 'GeometryNodeSplineParameter', None, (-200, -100), (), ()),
+
+    # Math nodes for the parabolic curve factor 2t(t - 1), pre-multiplied by the curve amount
+    ('math_curve_slope', 'ShaderNodeMath', "Math Curve Slope", (0, -50), (('operation', 'MULTIPLY_ADD'),), ((1, 2.0), (2, -2.0))),
+    ('math_curve_factor', 'ShaderNodeMath', "Math Curve Factor", (0, -150), (('operation', 'MULTIPLY'),), ()),
+    ('math_curve_amount', 'ShaderNodeMath', "Math Curve Amount", (0, -250), (('operation', 'MULTIPLY'),), ()),
+
+    # Vector math: midpoint of the strand, direction to the reference point, scaled offset
+    ('vec_math_midpoint', 'ShaderNodeVectorMath', "Vector Math Midpoint", (-400, -200), (('operation', 'ADD'),), ()),
+    ('vec_math_midpoint_scale', 'ShaderNodeVectorMath', "Vector Math Midpoint Scale", (-200, -200), (('operation', 'SCALE'),), ((3, -0.5),)),
+    ('vec_math_direction', 'ShaderNodeVectorMath', "Vector Math Direction", (-200, -300), (('operation', 'SUBTRACT'),), ()),
+    ('vec_math_normalize', 'ShaderNodeVectorMath', "Vector Math Normalize", (-200, -400), (('operation', 'NORMALIZE'),), ()),
+    ('vec_math_final_offset', 'ShaderNodeVectorMath', "Vector Math Final Offset", (200, -400), (('operation', 'SCALE'),), ()),
+
+    # Offset the samples, then sweep the circular profile along the strand
+    ('set_position', 'GeometryNodeSetPosition', None, (200, 100), (), (('Selection', True),)),
+    ('curve_circle', 'GeometryNodeCurvePrimitiveCircle', None, (200, 300), (('mode', 'RADIUS'),), (('Resolution', 16),)),
+    ('curve_to_mesh', 'GeometryNodeCurveToMesh', None, (400, 200), (), (('Fill Caps', True),)),
+)
+
+# Links as (from node, output socket, to node, input socket)
+_LINK_SPEC = (
+    # Inputs to Object Info nodes and other inputs
+    ('input', 'Web Center', 'obj_info_center', 'Object'),
+    ('input', 'Web Spoke', 'obj_info_spoke', 'Object'),
+    ('input', 'Web Origin', 'obj_info_origin', 'Object'),
+    ('input', 'Profile Radius', 'curve_circle', 'Radius'),
+    ('input', 'Curve Resolution', 'resample_curve', 'Count'),
+
+    # Object Info to Curve Line
+    ('obj_info_center', 'Location', 'curve_line', 'Start'),
+    ('obj_info_spoke', 'Location', 'curve_line', 'End'),
+
+    # Curve processing chain and profile
+    ('curve_line', 'Curve', 'resample_curve', 'Curve'),
+    ('resample_curve', 'Curve', 'set_position', 'Geometry'),
+    ('set_position', 'Geometry', 'curve_to_mesh', 'Curve'),
+    ('curve_circle', 'Curve', 'curve_to_mesh', 'Profile Curve'),
+
+    # Math for curve deformation (parabolic curve): (t * 2 - 2) * t * curve amount
+    ('spline_param', 'Factor', 'math_curve_slope', 0),
+    ('spline_param', 'Factor', 'math_curve_factor', 0),
+    ('math_curve_slope', 'Value', 'math_curve_factor', 1),
+    ('math_curve_factor', 'Value', 'math_curve_amount', 0),
+    ('input', 'Curve Amount', 'math_curve_amount', 1),
+
+    # Midpoint between start and end, then direction to the reference point
+    ('obj_info_center', 'Location', 'vec_math_midpoint', 0),
+    ('obj_info_spoke', 'Location', 'vec_math_midpoint', 1),
+    ('vec_math_midpoint', 'Vector', 'vec_math_midpoint_scale', 0),
+    ('obj_info_origin', 'Location', 'vec_math_direction', 0),
+    ('vec_math_midpoint_scale', 'Vector', 'vec_math_direction', 1),
+    ('vec_math_direction', 'Vector', 'vec_math_normalize', 0),
+
+    # Scale the direction once by the combined curve factor
+    ('vec_math_normalize', 'Vector', 'vec_math_final_offset', 0),
+    ('math_curve_amount', 'Value', 'vec_math_final_offset', 3),
+
+    # Final offset to set position, mesh to the output
+    ('vec_math_final_offset', 'Vector', 'set_position', 'Offset'),
+    ('curve_to_mesh', 'Mesh', 'output', 'Geometry'),
+)
+
+def create_web_curve_node_tree(name="WebCurveNodeTree", rebuild=False):
+    """Create the geometry node tree for web curves, reusing it if it already exists.
     
-    # Scale by curve formula and curve amount
-    node_tree.links.new(vec_math_normalize.outputs['Vector'], vec_math_scale_curve.inputs[0])
-    node_tree.links.new(math_008.outputs['Value'], vec_math_scale_curve.inputs[3])
+    Pass rebuild=True to regenerate the tree (e.g. after a Blender upgrade); webs already
+    using the old tree are switched over to the new one.
+    """
     
-    # Final scaling by curve amount input
-    node_tree.links.new(vec_math_scale_curve.outputs['Vector'], vec_math_final_offset.inputs[0])
-    node_tree.links.new(input_node.outputs['Curve Amount'], vec_math_final_offset.inputs[3])
+    # Every web drives the same tree through its modifier inputs, so build it only once
+    existing = bpy.data.node_groups.get(name)
+    if existing is not None and existing.bl_idname != 'GeometryNodeTree':
+        existing = None  # Some other kind of node group owns the name
+    if existing is not None and not rebuild:
+        return existing
     
-    # Link final offset to set position
-    node_tree.links.new(vec_math_final_offset.outputs['Vector'], set_position.inputs['Offset'])
+    # Create new node tree
+    node_tree = bpy.data.node_groups.new(name, 'GeometryNodeTree')
     
-    # Link final output
-    node_tree.links.new(curve_to_mesh.outputs['Mesh'], output_node.inputs['Geometry'])
+    # Create node tree interface in the correct order
+    new_socket = node_tree.interface.new_socket
+    for socket_name, socket_type, in_out, default_value in _INTERFACE_SPEC:
+        socket = new_socket(name=socket_name, socket_type=socket_type, in_out=in_out)
+        if default_value is not None:
+            socket.default_value = default_value
+    
+    # Create all nodes first, then all links, walking the specs above
+    new_node = node_tree.nodes.new
+    nodes = {}
+    for key, node_type, node_name, location, attributes, input_defaults in _NODE_SPEC:
+        node = new_node(node_type)
+        if node_name is not None:
+            node.name = node_name
+        node.location = location
+        for attribute, value in attributes:
+            setattr(node, attribute, value)
+        for socket, value in input_defaults:
+            node.inputs[socket].default_value = value
+        nodes[key] = node
+    
+    new_link = node_tree.links.new
+    for from_key, from_socket, to_key, to_socket in _LINK_SPEC:
+        new_link(nodes[from_key].outputs[from_socket], nodes[to_key].inputs[to_socket])
+    
+    if existing is not None:
+        # Point the webs still using the stale tree at the new one and take over its name
+        existing.user_remap(node_tree)
+        bpy.data.node_groups.remove(existing)
+        node_tree.name = name
     
     return node_tree
@@ -1,60 +1,381 @@
 import bpy
-from mathutils import Vector
-from bpy_extras.object_utils import AddObjectHelper, object_data_add
+import json
+from collections import OrderedDict
+from bpy.app.handlers import persistent
+from bpy.props import EnumProperty
 
-from .utils import *
 from .config import SpiderWebConfig
 from .spider_web import SpiderWeb
 from .spider_spread import SpiderSpread
 from .spider_shot import SpiderShot
 
-def find_web_components(context):
-    """Find all web components, prioritizing selected objects"""
-    selected_objects = context.selected_objects
+def format_location(location):
+    """Format a location for operator reports with one % operation instead of Vector's repr"""
+    return "(%.3f, %.3f, %.3f)" % tuple(location)
+
+# Roles of the web's core empties, keyed by their fixed 9-character name prefix
+_CORE_EMPTY_ROLES = {
+    "SpiderWeb": 'SPIDER_WEB',
+    "WebOrigin": 'ORIGIN',
+    "WebTarget": 'TARGET',
+}
+
+def classify_web_object(obj):
+    """Return the web component role of an object from its type and name prefix, or None"""
+    # Read the name once and compare fixed-length slices instead of chained startswith calls
+    name = obj.name
+    
+    # Every web component name starts with "Web" or "Spider"; reject everything else on its
+    # first character before paying for a second RNA read of the type
+    if name[:1] not in ("W", "S"):
+        return None
+    
+    obj_type = obj.type
+    if obj_type == 'EMPTY':
+        # One dict lookup for the core empties, then the generic "Web" prefix
+        role = _CORE_EMPTY_ROLES.get(name[:9])
+        if role is not None:
+            return role
+        if name[:3] == "Web":
+            return 'WEB_EMPTY'
+    elif obj_type == 'MESH':
+        if name[:3] == "Web":
+            return 'WEB_CURVE'
+        if name[:12] == "SpiderTether" or name[:16] == "SpiderProjectile":  # Also covers SpiderProjectileTrail
+            return 'SHOT'
+    return None
+
+def complete_web_core(spider_web_empty, origin_empty, target_empty, parts=()):
+    """Fill in missing core empties through the web's own links; returns (spider_web, origin, target)"""
+    # A strand or control point hangs below its web's target empty (strand -> center -> target)
+    if not spider_web_empty and not target_empty:
+        for part in parts:
+            parent = part.parent
+            while parent is not None and classify_web_object(parent) == 'WEB_EMPTY':
+                parent = parent.parent
+            if parent is not None and classify_web_object(parent) == 'TARGET':
+                target_empty = parent
+                break
+    
+    # Origin and target are parented to their SpiderWeb empty, which points back at both
+    if not spider_web_empty:
+        for empty in (origin_empty, target_empty):
+            if empty is not None and empty.parent is not None and classify_web_object(empty.parent) == 'SPIDER_WEB':
+                spider_web_empty = empty.parent
+                break
+    if spider_web_empty:
+        origin_empty = origin_empty or spider_web_empty.get("spider_web_origin")
+        target_empty = target_empty or spider_web_empty.get("spider_web_target")
+        
+        # Webs made before those links were stored: look among the SpiderWeb empty's children
+        if not origin_empty or not target_empty:
+            for child in spider_web_empty.children:
+                role = classify_web_object(child)
+                if role == 'ORIGIN' and not origin_empty:
+                    origin_empty = child
+                elif role == 'TARGET' and not target_empty:
+                    target_empty = child
     
+    return spider_web_empty, origin_empty, target_empty
+
+def find_web_core(context):
+    """Find the SpiderWeb, origin and target empties of the web to update, prioritizing selected objects"""
     spider_web_empty = None
     origin_empty = None
     target_empty = None
-    web_empties = []
-    web_curves = []
-    shot_objects = []  # For tethers, projectiles, trails
+    parts = []
+    
+    # Look for the web in the selection first
+    for obj in context.selected_objects:
+        role = classify_web_object(obj)
+        if role == 'SPIDER_WEB':
+            spider_web_empty = obj
+        elif role == 'ORIGIN':
+            origin_empty = obj
+        elif role == 'TARGET':
+            target_empty = obj
+        elif role == 'WEB_EMPTY' or role == 'WEB_CURVE':
+            parts.append(obj)
     
-    # Look for web components in selection first
-    for obj in selected_objects:
-        if obj.type == 'EMPTY':
-            if obj.name.startswith("SpiderWeb"):
+    core = complete_web_core(spider_web_empty, origin_empty, target_empty, parts)
+    if all(core):
+        return core
+    spider_web_empty, origin_empty, target_empty = core
+    
+    # Webs normally live in the active view layer; only widen the search to the rest of the
+    # scene (collections excluded from the view layer) when no web was found there.
+    # Objects in other scenes are never part of this scene's web.
+    # Classification stays a per-object loop: its cost is reading each name through RNA, which
+    # building a NumPy string array would pay the same way, and most names are rejected on
+    # their first character
+    classify = classify_web_object
+    for objects in (context.view_layer.objects, context.scene.objects):
+        for obj in objects:
+            role = classify(obj)
+            if role == 'SPIDER_WEB':
+                if spider_web_empty:
+                    continue
                 spider_web_empty = obj
-            elif obj.name.startswith("WebOrigin"):
+            elif role == 'ORIGIN':
+                if origin_empty:
+                    continue
                 origin_empty = obj
-            elif obj.name.startswith("WebTarget"):
+            elif role == 'TARGET':
+                if target_empty:
+                    continue
                 target_empty = obj
-            elif obj.name.startswith("Web"):
-                web_empties.append(obj)
-        elif obj.type == 'MESH':
-            if obj.name.startswith("Web"):
-                web_curves.append(obj)
-            elif obj.name.startswith("SpiderTether") or obj.name.startswith("SpiderProjectile") or obj.name.startswith("SpiderProjectileTrail"):
-                shot_objects.append(obj)
-    
-    # If we don't have all components, search all objects
-    if not spider_web_empty or not origin_empty or not target_empty:
-        for obj in bpy.data.objects:
-            if obj.type == 'EMPTY':
-                if obj.name.startswith("SpiderWeb") and not spider_web_empty:
-                    spider_web_empty = obj
-                elif obj.name.startswith("WebOrigin") and not origin_empty:
-                    origin_empty = obj
-                elif obj.name.startswith("WebTarget") and not target_empty:
-                    target_empty = obj
-                elif obj.name.startswith("Web") and obj not in web_empties:
-                    web_empties.append(obj)
-            elif obj.type == 'MESH':
-                if obj.name.startswith("Web") and obj not in web_curves:
-                    web_curves.append(obj)
-                elif (obj.name.startswith("SpiderTether") or obj.name.startswith("SpiderProjectile") or obj.name.startswith("SpiderProjectileTrail")) and obj not in shot_objects:
-                    shot_objects.append(obj)
-    
-    return spider_web_empty, origin_empty, target_empty, web_empties, web_curves, shot_objects
+            else:
+                continue
+            
+            # Any one core empty leads to the rest of its web, so stop as soon as the web is complete
+            spider_web_empty, origin_empty, target_empty = complete_web_core(spider_web_empty, origin_empty, target_empty)
+            if spider_web_empty and origin_empty and target_empty:
+                return spider_web_empty, origin_empty, target_empty
+    
+    return spider_web_empty, origin_empty, target_empty
+
+def collect_indexed_components(spider_web_empty, origin_empty, target_empty, collectors):
+    """Collect a web's parts from the names stored on its SpiderWeb empty; False if the index is missing or stale"""
+    names = spider_web_empty.get("spider_web_components")
+    if names is None:
+        return False
+    
+    get_object = bpy.data.objects.get
+    parts = []
+    for name in names:
+        obj = get_object(name)
+        if obj is None:
+            return False
+        role = classify_web_object(obj)
+        if role not in collectors:
+            return False
+        parts.append((role, obj))
+    
+    # A name may since have been taken by another web's object: this web's empties and strands
+    # all hang below its target through its own empties, and tethers point back at its origin
+    own_parents = {target_empty}
+    own_parents.update(obj for role, obj in parts if role == 'WEB_EMPTY')
+    for role, obj in parts:
+        if role == 'SHOT':
+            if obj.get("origin_empty") not in (None, origin_empty):
+                return False
+        elif obj.parent not in own_parents:
+            return False
+    
+    # Everything checks out
+    for role, obj in parts:
+        collectors[role](obj)
+    return True
+
+def find_web_parts(context, spider_web_empty, origin_empty, target_empty):
+    """Find a web's control empties, strands and shot objects; returns (web_empties, web_curves, shot_objects)"""
+    web_empties = []  # Never contains the SpiderWeb, origin or target empties
+    web_curves = []
+    shot_objects = []  # For tethers, projectiles, trails
+    
+    # The list each collected role is appended to, so a role is dispatched with one dict lookup
+    collectors = {
+        'WEB_EMPTY': web_empties.append,
+        'WEB_CURVE': web_curves.append,
+        'SHOT': shot_objects.append,
+    }
+    
+    # Webs list their parts on the SpiderWeb empty, so they can be looked up by name
+    if collect_indexed_components(spider_web_empty, origin_empty, target_empty, collectors):
+        return web_empties, web_curves, shot_objects
+    
+    # No usable index (older web, or parts renamed or deleted since): search for the parts.
+    # Its empties and strands all hang below the target empty; shots aren't parented, so they
+    # are searched for, skipping tethers that belong to another web's origin
+    classify = classify_web_object
+    for obj in target_empty.children_recursive:
+        role = classify(obj)
+        if role == 'WEB_EMPTY' or role == 'WEB_CURVE':
+            collectors[role](obj)
+    for obj in context.view_layer.objects:
+        if classify(obj) == 'SHOT' and obj.get("origin_empty") in (None, origin_empty):
+            shot_objects.append(obj)
+    
+    return web_empties, web_curves, shot_objects
+
+# Parsed configs by SpiderWeb empty pointer, with the packed JSON they were parsed from. Least
+# recently used entries are dropped past _CONFIG_CACHE_SIZE, so deleted webs don't pile up
+_config_cache = OrderedDict()
+_CONFIG_CACHE_SIZE = 64
+
+@persistent
+def clear_config_cache(*args):
+    """Forget the cached configs when a .blend file is loaded (load_post handler)"""
+    _config_cache.clear()
+
+def _cache_config(pointer, packed_config, config):
+    """Remember a parsed config for a SpiderWeb empty, evicting the least recently used past the limit"""
+    _config_cache[pointer] = (packed_config, config)
+    _config_cache.move_to_end(pointer)
+    if len(_config_cache) > _CONFIG_CACHE_SIZE:
+        _config_cache.popitem(last=False)
+
+def load_original_config_from_web(spider_web_empty):
+    """Load the original configuration from the web's stored properties, ignoring the panel"""
+    # Webs store their whole config as one JSON property; older webs only have a property per setting
+    packed_config = spider_web_empty.get("spider_web_config")
+    if packed_config:
+        # Reuse the config parsed last time if the stored JSON hasn't changed since
+        # (the returned config is shared, callers only read it)
+        pointer = spider_web_empty.as_pointer()
+        cached = _config_cache.get(pointer)
+        if cached is not None and cached[0] == packed_config:
+            _config_cache.move_to_end(pointer)
+            return cached[1]
+        try:
+            config = SpiderWebConfig.from_dict(json.loads(packed_config))
+        except ValueError:
+            pass  # Unreadable, fall back to the individual properties
+        else:
+            _cache_config(pointer, packed_config, config)
+            return config
+    
+    config = SpiderWebConfig()
+    
+    # Load spider spread config from SpiderWeb empty
+    spread_config = SpiderSpread.load_config_from_empty(spider_web_empty)
+    config.spider_spread_config = spread_config
+    
+    # Load spider shot config from SpiderWeb empty  
+    shot_config = SpiderShot.load_config_from_empty(spider_web_empty)
+    config.spider_shot_config = shot_config
+    
+    # Load web-level config if it exists
+    animate_web = spider_web_empty.get("spider_web_animate_web")
+    if animate_web is not None:
+        config.animate_web = animate_web
+    start_frame = spider_web_empty.get("spider_web_start_frame")
+    if start_frame is not None:
+        config.start_frame = int(start_frame)
+    
+    return config
+
+def remember_web_config(spider_web_empty, config):
+    """Cache the config a web was just built from, so its next update doesn't parse it back"""
+    _cache_config(spider_web_empty.as_pointer(), spider_web_empty["spider_web_config"], config)
+
+def cleanup_web_components(web_empties, web_curves, shot_objects):
+    """Delete all web components except SpiderWeb, origin and target empties"""
+    # Web curves, shot objects (tethers, projectiles, trails) and web empties
+    # (find_web_parts never puts SpiderWeb, origin or target empties in these lists)
+    mesh_objects = web_curves + shot_objects
+    objects_to_delete = mesh_objects + web_empties
+    
+    # Mesh data of the deleted objects (shared strand mesh, tether, projectile) would otherwise
+    # pile up as orphans on every update; remember it so it can go in the same batch.
+    # A set, since every strand shares one mesh
+    meshes = {obj.data for obj in mesh_objects if obj.data is not None}
+    
+    # Check for batch_remove up front: catching an AttributeError from the removal itself could
+    # retry the per-object loop on objects the batch had already freed
+    if hasattr(bpy.data, "batch_remove"):
+        # Remove everything in a single pass instead of one depsgraph update per object
+        if objects_to_delete:
+            bpy.data.batch_remove(ids=objects_to_delete)
+        orphaned_meshes = [mesh for mesh in meshes if mesh.users == 0]
+        if orphaned_meshes:
+            bpy.data.batch_remove(ids=orphaned_meshes)
+    else:
+        # Older Blender versions without batch_remove
+        remove = bpy.data.objects.remove
+        for obj in objects_to_delete:
+            remove(obj, do_unlink=True)
+        for mesh in meshes:
+            if mesh.users == 0:
+                bpy.data.meshes.remove(mesh)
+
+def rebuild_web(context, components, origin, target, config, edge_random=None, interior_random=None, allow_relocate=False):
+    """Rebuild a found web at the given positions with the given config, reusing its core empties.
+    
+    components is the web's core empties followed by the lists returned by find_web_parts. Random
+    values that are passed in are restored before the spread is created; missing ones are generated
+    fresh. With allow_relocate, a static web whose control points match its config is moved in place
+    instead of rebuilt.
+    """
+    spider_web_empty, origin_empty, target_empty, web_empties, web_curves, shot_objects = components
+    
+    spider_web = SpiderWeb(origin, target, config)
+    spider_shot = spider_web.spider_shot
+    spider_spread = spider_web.spider_spread
+    
+    # Restore the existing random values to preserve the web's exact appearance
+    spider_spread.set_random_values(edge_random, interior_random)
+    
+    # A static web keeps its topology when only moved: relocate its control points in place
+    # and let the strand modifiers follow them. Animated webs have keyframed positions, so they
+    # (and webs whose empties don't match their config) are rebuilt.
+    keep_shot = False
+    if allow_relocate and not config.animate_web and spider_spread.relocate_spread(target_empty, web_empties):
+        # The strands were kept, so they stay part of the web
+        spider_spread.mesh_objs = list(web_curves)
+        
+        # A tether follows the origin and web center through its constraints, so only its length
+        # needs refreshing. A projectile is positioned from the old locations and is recreated
+        web_center_empty = spider_spread.web_center
+        keep_shot = (
+            config.spider_shot_config.is_tethered
+            and len(shot_objects) == 1
+            and shot_objects[0].get("web_center_empty") == web_center_empty
+        )
+        if keep_shot:
+            tether_handler = spider_shot.shot_handler
+            tether_handler.tether_mesh = shot_objects[0]
+            tether_handler.update_tether_length(shot_objects[0])
+        else:
+            cleanup_web_components([], [], shot_objects)
+    else:
+        # Delete all existing web components except SpiderWeb, origin and target
+        cleanup_web_components(web_empties, web_curves, shot_objects)
+        
+        # Create the spread using existing origin and target empties
+        spider_spread.create_spread(origin_empty, target_empty)
+        spider_spread.create_mesh(context, origin_empty, target_empty)
+    
+    # Create shot (tether or projectile) unless the existing tether was kept
+    if not keep_shot:
+        if config.spider_shot_config.is_tethered:
+            # For tethered shots, we need web_center_empty for the tether connection
+            web_center_empty = spider_spread.web_center
+            spider_shot.create_shot(context, origin_empty, target_empty, web_center_empty)
+        else:
+            # For projectile shots
+            spider_shot.create_shot(context, origin_empty, target_empty)
+    
+    # Animate everything if enabled
+    if config.animate_web:
+        start_frame = config.start_frame
+        
+        # Animate the shot first
+        spider_shot.animate_shot(
+            context, origin_empty, target_empty, 
+            start_frame
+        )
+        
+        # Calculate when the spread should start (after shot completes)
+        render = context.scene.render
+        fps = render.fps / render.fps_base
+        shot_travel_time = config.spider_shot_config.shoot_time  # in seconds
+        spread_start_frame = start_frame + int(shot_travel_time * fps)
+        
+        # Animate the spread starting after the shot reaches the target
+        spider_spread.animate_spread(
+            context, origin_empty, target_empty, 
+            spread_start_frame,  # Start after shot completes
+            config.spider_spread_config.spread_time
+        )
+    
+    # Store the config (including random values) on the SpiderWeb empty
+    spider_spread.store_random_values_on_empty(spider_web_empty)
+    spider_web.store_config_on_empty(spider_web_empty)
+    spider_web.store_components_on_empty(spider_web_empty)
+    remember_web_config(spider_web_empty, config)
+    
+    return spider_web
 
 class MESH_OT_create_spider_web_from_coords(bpy.types.Operator):
     bl_idname = "mesh.create_spider_web_coords"
@@ -73,7 +394,7 @@ class MESH_OT_create_spider_web_from_coords(bpy.types.Operator):
             spider_web = SpiderWeb(origin, target, config)
             spider_web.create_web(context)
             
-            self.report({'INFO'}, f"Created web from {origin} to {target}")
+            self.report({'INFO'}, "Created web from %s to %s" % (format_location(origin), format_location(target)))
             return {'FINISHED'}
             
         except Exception as e:
@@ -81,16 +402,44 @@ class MESH_OT_create_spider_web_from_coords(bpy.types.Operator):
             print(f"Spider web creation error: {e}")
             return {'CANCELLED'}
 
-class MESH_OT_update_spider_web_position(bpy.types.Operator):
-    bl_idname = "mesh.update_spider_web_position"
-    bl_label = "Update Selected Web Position"
-    bl_description = "Update position of spider web based on origin and target empty positions (preserves all original properties)"
+# Update modes of MESH_OT_update_spider_web, with their button descriptions
+_UPDATE_MODES = (
+    ('POSITION', "Position", "Update position of spider web based on origin and target empty positions (preserves all original properties)"),
+    ('PROPERTIES', "Properties", "Update all properties of spider web using current panel settings (preserves positions)"),
+)
+
+class MESH_OT_update_spider_web(bpy.types.Operator):
+    bl_idname = "mesh.update_spider_web"
+    bl_label = "Update Selected Web"
+    bl_description = "Update the selected spider web"
     bl_options = {'REGISTER', 'UNDO'}
     
+    mode: EnumProperty(
+        name="Mode",
+        description="What to update the selected web from",
+        items=_UPDATE_MODES,
+        default='PROPERTIES',
+        # The two modes do very different things, so never reuse the last run's mode
+        options={'SKIP_SAVE'}
+    )
+    
+    @classmethod
+    def description(cls, context, properties):
+        for identifier, _name, description in _UPDATE_MODES:
+            if identifier == properties.mode:
+                return description
+        return cls.bl_description
+    
     def execute(self, context):
+        if self.mode == 'POSITION':
+            return self.update_position(context)
+        return self.update_properties(context)
+    
+    def update_position(self, context):
+        """Rebuild the web at its empties' current positions with its original settings"""
         try:
-            # Find spider web components
-            spider_web_empty, origin_empty, target_empty, web_empties, web_curves, shot_objects = find_web_components(context)
+            # Find the web's core empties; its parts are only gathered once there is a web to update
+            spider_web_empty, origin_empty, target_empty = find_web_core(context)
             
             if not spider_web_empty or not origin_empty or not target_empty:
                 self.report({'ERROR'}, "Could not find SpiderWeb, WebOrigin and WebTarget empties")
@@ -98,7 +447,7 @@ class MESH_OT_update_spider_web_position(bpy.types.Operator):
             
             # Load the ORIGINAL configuration from the SpiderWeb empty's custom properties
             # This preserves ALL original settings and ignores current panel settings
-            original_config = self.load_original_config_from_web(spider_web_empty)
+            original_config = load_original_config_from_web(spider_web_empty)
             
             # Load the existing random values from the SpiderWeb empty to preserve exact appearance
             existing_edge_random, existing_interior_random = SpiderSpread.load_random_values_from_empty(
@@ -108,56 +457,18 @@ class MESH_OT_update_spider_web_position(bpy.types.Operator):
             )
             
             # Get new origin and target positions from the empties (convert to world coordinates)
-            new_origin = origin_empty.matrix_world.translation
-            new_target = target_empty.matrix_world.translation
-            
-            # Delete all existing web components except SpiderWeb, origin and target
-            self.cleanup_web_components(web_empties, web_curves, shot_objects)
-            
-            # Create new spider web with updated positions but ORIGINAL configuration
-            spider_web = SpiderWeb(new_origin, new_target, original_config)
-            
-            # Restore the existing random values to preserve the web's exact appearance
-            spider_web.spider_spread.set_random_values(existing_edge_random, existing_interior_random)
-            
-            # Create the spread using existing origin and target empties
-            spider_web.spider_spread.create_spread(origin_empty, target_empty)
-            spider_web.spider_spread.create_mesh(context, origin_empty, target_empty)
-            
-            # Create shot (tether or projectile) with original settings
-            if original_config.spider_shot_config.is_tethered:
-                # For tethered shots, we need web_center_empty for the tether connection
-                web_center_empty = spider_web.spider_spread.web_center
-                spider_web.spider_shot.create_shot(context, origin_empty, target_empty, web_center_empty)
-            else:
-                # For projectile shots
-                spider_web.spider_shot.create_shot(context, origin_empty, target_empty)
-            
-            # Animate everything if enabled
-            if spider_web.config.animate_web:
-                # Animate the shot first
-                spider_web.spider_shot.animate_shot(
-                    context, origin_empty, target_empty, 
-                    spider_web.config.start_frame
-                )
-                
-                # Calculate when the spread should start (after shot completes)
-                shot_travel_time = spider_web.config.spider_shot_config.shoot_time  # in seconds
-                spread_start_frame = spider_web.config.start_frame + int(shot_travel_time * (context.scene.render.fps / context.scene.render.fps_base))
-                
-                # Animate the spread starting after the shot reaches the target
-                spider_web.spider_spread.animate_spread(
-                    context, origin_empty, target_empty, 
-                    spread_start_frame,  # Start after shot completes
-                    spider_web.config.spider_spread_config.spread_time
-                )
+            new_origin = origin_empty.matrix_world.to_translation()
+            new_target = target_empty.matrix_world.to_translation()
             
-            # Store the config back (preserving all original settings including random values)
-            spider_web.spider_shot.store_config_on_empty(spider_web_empty)
-            spider_web.spider_spread.store_config_on_empty(spider_web_empty)
-            spider_web.store_config_on_empty(spider_web_empty)
+            # Rebuild (or relocate) the web at the new positions with its ORIGINAL configuration
+            components = (spider_web_empty, origin_empty, target_empty,
+                          *find_web_parts(context, spider_web_empty, origin_empty, target_empty))
+            rebuild_web(
+                context, components, new_origin, new_target, original_config,
+                existing_edge_random, existing_interior_random, allow_relocate=True
+            )
             
-            self.report({'INFO'}, f"Updated spider web position from {new_origin} to {new_target} with original settings preserved")
+            self.report({'INFO'}, "Updated spider web position from %s to %s with original settings preserved" % (format_location(new_origin), format_location(new_target)))
             return {'FINISHED'}
             
         except Exception as e:
@@ -165,133 +476,70 @@ class MESH_OT_update_spider_web_position(bpy.types.Operator):
             print(f"Spider web position update error: {e}")
             return {'CANCELLED'}
     
-    def load_original_config_from_web(self, spider_web_empty):
-        """Load the original configuration from the web's stored properties, ignoring panel"""
-        config = SpiderWebConfig()
-        
-        # Load spider spread config from SpiderWeb empty
-        spread_config = SpiderSpread.load_config_from_empty(spider_web_empty)
-        config.spider_spread_config = spread_config
-        
-        # Load spider shot config from SpiderWeb empty  
-        shot_config = SpiderShot.load_config_from_empty(spider_web_empty)
-        config.spider_shot_config = shot_config
-        
-        # Load web-level config if it exists
-        if "spider_web_animate_web" in spider_web_empty:
-            config.animate_web = spider_web_empty["spider_web_animate_web"]
-        if "spider_web_start_frame" in spider_web_empty:
-            config.start_frame = int(spider_web_empty["spider_web_start_frame"])
-        
-        return config
-    
-    def cleanup_web_components(self, web_empties, web_curves, shot_objects):
-        """Delete all web components except SpiderWeb, origin and target empties"""
-        # Delete web curve objects
-        for curve_obj in web_curves:
-            bpy.data.objects.remove(curve_obj, do_unlink=True)
-        
-        # Delete shot objects (tethers, projectiles, trails)
-        for shot_obj in shot_objects:
-            bpy.data.objects.remove(shot_obj, do_unlink=True)
-        
-        # Delete web empties except SpiderWeb, origin and target
-        empties_to_delete = [obj for obj in web_empties 
-                           if not obj.name.startswith("SpiderWeb")
-                           and not obj.name.startswith("WebOrigin") 
-                           and not obj.name.startswith("WebTarget")]
-        for empty in empties_to_delete:
-            bpy.data.objects.remove(empty, do_unlink=True)
-
-class MESH_OT_update_spider_web_selected(bpy.types.Operator):
-    bl_idname = "mesh.update_spider_web"
-    bl_label = "Update Selected Web Properties"
-    bl_description = "Update all properties of spider web using current panel settings (preserves positions)"
-    bl_options = {'REGISTER', 'UNDO'}
-    
-    def execute(self, context):
+    def update_properties(self, context):
+        """Rebuild the web in place with the current panel settings"""
         try:
-            # Find spider web components
-            spider_web_empty, origin_empty, target_empty, web_empties, web_curves, shot_objects = find_web_components(context)
+            # Find the web's core empties; its parts are only gathered once there is a web to update
+            spider_web_empty, origin_empty, target_empty = find_web_core(context)
             
             if not spider_web_empty or not origin_empty or not target_empty:
                 self.report({'ERROR'}, "Could not find SpiderWeb, WebOrigin and WebTarget empties")
                 return {'CANCELLED'}
             
             # Get CURRENT positions from the empties (preserve these positions)
-            current_origin = origin_empty.matrix_world.translation
-            current_target = target_empty.matrix_world.translation
+            current_origin = origin_empty.matrix_world.to_translation()
+            current_target = target_empty.matrix_world.to_translation()
             
             # Get NEW configuration from panel properties
             props = context.scene.spider_web_props
             new_config = props.to_config()
             
+            # The config the web was last built from (cached between updates, so usually not re-parsed)
+            old_config = load_original_config_from_web(spider_web_empty)
+            
+            # Nothing to do if the web was built from this exact config at these positions;
+            # the dataclasses compare field by field, without serializing the panel config
+            built_positions = spider_web_empty.get("spider_web_built_positions")
+            if (old_config == new_config
+                    and built_positions is not None
+                    and all(abs(a - b) <= 1e-6 for a, b in zip(built_positions, [*current_origin, *current_target]))):
+                self.report({'INFO'}, "No changes to apply")
+                return {'CANCELLED'}
+            
             # Check if randomness settings have changed - if not, preserve existing random values
-            old_config = self.load_original_config_from_web(spider_web_empty)
-            preserve_random_values = (
-                old_config.spider_spread_config.random_spread_edge == new_config.spider_spread_config.random_spread_edge and
-                old_config.spider_spread_config.random_spread_interior == new_config.spider_spread_config.random_spread_interior and
-                old_config.spider_spread_config.density_spoke == new_config.spider_spread_config.density_spoke and
-                old_config.spider_spread_config.density_rib == new_config.spider_spread_config.density_rib
-            )
+            new_spread_config = new_config.spider_spread_config
+            stored_pattern = spider_web_empty.get("spider_spread_random_pattern")
+            if stored_pattern is not None:
+                # The settings the stored values were drawn for, compared in one read
+                preserve_random_values = list(stored_pattern) == SpiderSpread.random_pattern_key(new_spread_config)
+            else:
+                # Older webs: compare against their full stored config
+                old_spread_config = old_config.spider_spread_config
+                preserve_random_values = (
+                    old_spread_config.density_spoke == new_spread_config.density_spoke and
+                    old_spread_config.density_rib == new_spread_config.density_rib and
+                    old_spread_config.random_spread_edge == new_spread_config.random_spread_edge and
+                    old_spread_config.random_spread_interior == new_spread_config.random_spread_interior
+                )
             
-            existing_edge_random = {}
-            existing_interior_random = {}
+            existing_edge_random = None
+            existing_interior_random = None
             
             if preserve_random_values:
                 # Load existing random values to preserve web appearance
                 existing_edge_random, existing_interior_random = SpiderSpread.load_random_values_from_empty(
                     spider_web_empty, 
-                    old_config.spider_spread_config.density_spoke, 
-                    old_config.spider_spread_config.density_rib
-                )
-            
-            # Delete all existing web components except SpiderWeb, origin and target
-            self.cleanup_web_components(web_empties, web_curves, shot_objects)
-            
-            # Create new spider web with current positions and NEW properties from panel
-            spider_web = SpiderWeb(current_origin, current_target, new_config)
-            
-            # If preserving random values, restore them before creating the spread
-            if preserve_random_values and existing_edge_random and existing_interior_random:
-                spider_web.spider_spread.set_random_values(existing_edge_random, existing_interior_random)
-            
-            # Create the spread using existing origin and target empties
-            spider_web.spider_spread.create_spread(origin_empty, target_empty)
-            spider_web.spider_spread.create_mesh(context, origin_empty, target_empty)
-
-            # Create shot (tether or projectile) with new settings
-            if new_config.spider_shot_config.is_tethered:
-                # For tethered shots, we need web_center_empty for the tether connection
-                web_center_empty = spider_web.spider_spread.web_center
-                spider_web.spider_shot.create_shot(context, origin_empty, target_empty, web_center_empty)
-            else:
-                # For projectile shots
-                spider_web.spider_shot.create_shot(context, origin_empty, target_empty)
-
-            # Animate everything if enabled
-            if spider_web.config.animate_web:
-                # Animate the shot first
-                spider_web.spider_shot.animate_shot(
-                    context, origin_empty, target_empty, 
-                    spider_web.config.start_frame
-                )
-                
-                # Calculate when the spread should start (after shot completes)
-                shot_travel_time = spider_web.config.spider_shot_config.shoot_time  # in seconds
-                spread_start_frame = spider_web.config.start_frame + int(shot_travel_time * (context.scene.render.fps / context.scene.render.fps_base))
-                
-                # Animate the spread starting after the shot reaches the target
-                spider_web.spider_spread.animate_spread(
-                    context, origin_empty, target_empty, 
-                    spread_start_frame,  # Start after shot completes
-                    spider_web.config.spider_spread_config.spread_time
+                    new_spread_config.density_spoke, 
+                    new_spread_config.density_rib
                 )
             
-            # Store updated config on the SpiderWeb empty
-            spider_web.spider_shot.store_config_on_empty(spider_web_empty)
-            spider_web.spider_spread.store_config_on_empty(spider_web_empty)
-            spider_web.store_config_on_empty(spider_web_empty)
+            # Rebuild the web at its current positions with the NEW properties from the panel
+            components = (spider_web_empty, origin_empty, target_empty,
+                          *find_web_parts(context, spider_web_empty, origin_empty, target_empty))
+            rebuild_web(
+                context, components, current_origin, current_target, new_config,
+                existing_edge_random, existing_interior_random
+            )
             
             if preserve_random_values:
                 self.report({'INFO'}, "Updated spider web with new properties (preserved random pattern)")
@@ -303,44 +551,6 @@ class MESH_OT_update_spider_web_selected(bpy.types.Operator):
             self.report({'ERROR'}, f"Error updating spider web properties: {str(e)}")
             print(f"Spider web property update error: {e}")
             return {'CANCELLED'}
-    
-    def load_original_config_from_web(self, spider_web_empty):
-        """Load the original configuration from the web's stored properties"""
-        config = SpiderWebConfig()
-        
-        # Load spider spread config from SpiderWeb empty
-        spread_config = SpiderSpread.load_config_from_empty(spider_web_empty)
-        config.spider_spread_config = spread_config
-        
-        # Load spider shot config from SpiderWeb empty  
-        shot_config = SpiderShot.load_config_from_empty(spider_web_empty)
-        config.spider_shot_config = shot_config
-        
-        # Load web-level config if it exists
-        if "spider_web_animate_web" in spider_web_empty:
-            config.animate_web = spider_web_empty["spider_web_animate_web"]
-        if "spider_web_start_frame" in spider_web_empty:
-            config.start_frame = int(spider_web_empty["spider_web_start_frame"])
-        
-        return config
-    
-    def cleanup_web_components(self, web_empties, web_curves, shot_objects):
-        """Delete all web components except SpiderWeb, origin and target empties"""
-        # Delete web curve objects
-        for curve_obj in web_curves:
-            bpy.data.objects.remove(curve_obj, do_unlink=True)
-        
-        # Delete shot objects (tethers, projectiles, trails)
-        for shot_obj in shot_objects:
-            bpy.data.objects.remove(shot_obj, do_unlink=True)
-        
-        # Delete web empties except SpiderWeb, origin and target
-        empties_to_delete = [obj for obj in web_empties 
-                           if not obj.name.startswith("SpiderWeb")
-                           and not obj.name.startswith("WebOrigin") 
-                           and not obj.name.startswith("WebTarget")]
-        for empty in empties_to_delete:
-            bpy.data.objects.remove(empty, do_unlink=True)
 
 class MESH_OT_set_origin_from_cursor(bpy.types.Operator):
     bl_idname = "mesh.set_origin_cursor"
@@ -349,9 +559,9 @@ class MESH_OT_set_origin_from_cursor(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
-        cursor_loc = context.scene.cursor.location
+        cursor_loc = context.scene.cursor.location.copy()
         context.scene.spider_web_props.set_origin(cursor_loc)
-        self.report({'INFO'}, f"Origin set to {cursor_loc}")
+        self.report({'INFO'}, "Origin set to %s" % format_location(cursor_loc))
         return {'FINISHED'}
 
 class MESH_OT_set_target_from_cursor(bpy.types.Operator):
@@ -361,7 +571,7 @@ class MESH_OT_set_target_from_cursor(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
-        cursor_loc = context.scene.cursor.location
+        cursor_loc = context.scene.cursor.location.copy()
         context.scene.spider_web_props.set_target(cursor_loc)
-        self.report({'INFO'}, f"Target set to {cursor_loc}")
+        self.report({'INFO'}, "Target set to %s" % format_location(cursor_loc))
         return {'FINISHED'}
\ No newline at end of file
@@ -31,9 +31,7 @@ class VIEW3D_PT_spider_web_panel(bpy.types.Panel):
         col = box.column()
         col.label(text="Origin:")
         row = col.row(align=True)
-        row.prop(props, "origin_x", text="X")
-        row.prop(props, "origin_y", text="Y") 
-        row.prop(props, "origin_z", text="Z")
+        row.prop(props, "origin", text="")
         
         # Helper buttons for origin
         row = col.row(align=True)
@@ -44,9 +42,7 @@ class VIEW3D_PT_spider_web_panel(bpy.types.Panel):
         # Target coordinates
         col.label(text="Target:")
         row = col.row(align=True)
-        row.prop(props, "target_x", text="X")
-        row.prop(props, "target_y", text="Y")
-        row.prop(props, "target_z", text="Z")
+        row.prop(props, "target", text="")
         
         # Helper buttons for target
         row = col.row(align=True)
@@ -54,37 +50,43 @@ class VIEW3D_PT_spider_web_panel(bpy.types.Panel):
 
         col.separator()
         
+        # Resolve the property groups once per redraw instead of on every prop() call
+        shot_props = props.shot_props
+        spread_props = props.spread_props
+        
         # Shot Properties Section
         box = layout.box()
         box.label(text="Shot Properties", icon='PARTICLES')
-        box.prop(props.shot_props, "shoot_time")
-        box.prop(props.shot_props, "is_tethered")
+        col = box.column()
+        col.prop(shot_props, "shoot_time")
+        col.prop(shot_props, "is_tethered")
         
-        if props.shot_props.is_tethered:
-            box.prop(props.shot_props, "tether_width")
-            box.prop(props.shot_props, "tether_slack")
+        if shot_props.is_tethered:
+            col.prop(shot_props, "tether_width")
+            col.prop(shot_props, "tether_slack")
         else:
-            box.prop(props.shot_props, "projectile_size")
-            box.prop(props.shot_props, "projectile_trail_length")
+            col.prop(shot_props, "projectile_size")
+            col.prop(shot_props, "projectile_trail_length")
         
         # Spread Properties Section
         box = layout.box()
         box.label(text="Spread Properties", icon='MESH_GRID')
-        box.prop(props.spread_props, "radius")
-        box.prop(props.spread_props, "height")
-        box.prop(props.spread_props, "spread_time")
+        col = box.column()
+        col.prop(spread_props, "radius")
+        col.prop(spread_props, "height")
+        col.prop(spread_props, "spread_time")
         
-        row = box.row()
-        row.prop(props.spread_props, "density_spoke")
-        row.prop(props.spread_props, "density_rib")
+        row = col.row()
+        row.prop(spread_props, "density_spoke")
+        row.prop(spread_props, "density_rib")
         
-        box.prop(props.spread_props, "web_thickness")
-        box.prop(props.spread_props, "curvature")
+        col.prop(spread_props, "web_thickness")
+        col.prop(spread_props, "curvature")
         
         col = box.column()
         col.label(text="Randomness:")
-        col.prop(props.spread_props, "random_spread_edge")
-        col.prop(props.spread_props, "random_spread_interior")
+        col.prop(spread_props, "random_spread_edge")
+        col.prop(spread_props, "random_spread_interior")
         
         # Action buttons
         layout.separator()
@@ -92,8 +94,8 @@ class VIEW3D_PT_spider_web_panel(bpy.types.Panel):
         
         col = layout.column(align=True)
         col.operator("mesh.create_spider_web_coords", text="Create from Coordinates", icon='MESH_GRID')
-        col.operator("mesh.update_spider_web_position", text="Update Selected Position", icon="EMPTY_ARROWS")
-        col.operator("mesh.update_spider_web", text="Update Selected Properties", icon='LIGHT_POINT')
+        col.operator("mesh.update_spider_web", text="Update Selected Position", icon="EMPTY_ARROWS").mode = 'POSITION'
+        col.operator("mesh.update_spider_web", text="Update Selected Properties", icon='LIGHT_POINT').mode = 'PROPERTIES'
         
         # Animation controls
         if props.animate_web:
@@ -1,7 +1,69 @@
 import bpy
+import numpy as np
 from typing import Tuple
-from mathutils import Vector
 from .config import SpiderShotConfig
+from .utils import insert_keyframes, get_shared_mesh, get_material, unit_uv_sphere, unit_cylinder, new_mesh
+
+def _build_projectile_material(name):
+    """Build the glowing, partly transparent projectile material"""
+    material = bpy.data.materials.new(name=name)
+    material.use_nodes = True
+    nodes = material.node_tree.nodes
+    nodes.clear()
+    
+    # Create emission shader for glowing effect
+    emission = nodes.new(type='ShaderNodeEmission')
+    emission.inputs['Color'].default_value = (0.9, 0.9, 1.0, 1.0)  # Slightly blue-white
+    emission.inputs['Strength'].default_value = 2.0
+    
+    # Add some transparency
+    transparent = nodes.new(type='ShaderNodeBsdfTransparent')
+    mix = nodes.new(type='ShaderNodeMixShader')
+    mix.inputs['Fac'].default_value = 0.3  # 30% transparent
+    
+    output = nodes.new(type='ShaderNodeOutputMaterial')
+    
+    # Connect nodes
+    material.node_tree.links.new(transparent.outputs['BSDF'], mix.inputs[1])
+    material.node_tree.links.new(emission.outputs['Emission'], mix.inputs[2])
+    material.node_tree.links.new(mix.outputs['Shader'], output.inputs['Surface'])
+    return material
+
+def _build_trail_material(name):
+    """Build the trail material, fading out along the trail"""
+    material = bpy.data.materials.new(name=name)
+    material.use_nodes = True
+    material.blend_method = 'BLEND'  # Enable transparency
+    
+    nodes = material.node_tree.nodes
+    nodes.clear()
+    
+    # Create emission shader with gradient
+    emission = nodes.new(type='ShaderNodeEmission')
+    emission.inputs['Color'].default_value = (0.7, 0.7, 1.0, 1.0)  # Light blue
+    emission.inputs['Strength'].default_value = 1.0
+    
+    # Add transparency with gradient
+    transparent = nodes.new(type='ShaderNodeBsdfTransparent')
+    
+    # Color ramp for gradient effect
+    color_ramp = nodes.new(type='ShaderNodeValToRGB')
+    color_ramp.color_ramp.elements[0].color = (1, 1, 1, 0)  # Transparent
+    color_ramp.color_ramp.elements[1].color = (1, 1, 1, 1)  # Opaque
+    
+    # Texture coordinate for gradient
+    tex_coord = nodes.new(type='ShaderNodeTexCoord')
+    
+    mix = nodes.new(type='ShaderNodeMixShader')
+    output = nodes.new(type='ShaderNodeOutputMaterial')
+    
+    # Connect nodes for gradient transparency
+    material.node_tree.links.new(tex_coord.outputs['Generated'], color_ramp.inputs['Fac'])
+    material.node_tree.links.new(color_ramp.outputs['Alpha'], mix.inputs['Fac'])
+    material.node_tree.links.new(transparent.outputs['BSDF'], mix.inputs[1])
+    material.node_tree.links.new(emission.outputs['Emission'], mix.inputs[2])
+    material.node_tree.links.new(mix.outputs['Shader'], output.inputs['Surface'])
+    return material
 
 class ProjectileShot:
     """Handles projectile spider web shots"""
@@ -20,20 +82,27 @@ class ProjectileShot:
     def create_shot_mesh(self, context, origin_empty, target_empty):
         """Create the projectile mesh for non-tethered shots"""
         
-        # Create projectile sphere
-        bpy.ops.mesh.primitive_uv_sphere_add(
-            radius=self.config.projectile_size,
-            location=origin_empty.location
+        # Create projectile sphere directly through bpy.data rather than the operator, which
+        # updates the whole scene and shuffles the active object on every shot. Projectiles of
+        # the same size share one mesh
+        size = self.config.projectile_size
+        co, loop_totals, vertex_indices = unit_uv_sphere()
+        mesh = get_shared_mesh(
+            ("SpiderProjectile", size),
+            lambda: new_mesh(
+                "SpiderProjectile", co * size, loop_totals, vertex_indices,
+                get_material("SpiderProjectile_Material", _build_projectile_material)
+            )
         )
         
-        projectile_obj = context.active_object
-        projectile_obj.name = "SpiderProjectile"
+        projectile_obj = bpy.data.objects.new("SpiderProjectile", mesh)
+        context.collection.objects.link(projectile_obj)
+        projectile_obj.location = origin_empty.location
         
-        # Store reference
+        # Store reference, and tag the projectile with its web's origin like a tether, so updates
+        # only collect this web's shots
         self.shot_mesh = projectile_obj
-        
-        # Apply projectile material
-        self._apply_projectile_material(projectile_obj)
+        projectile_obj["origin_empty"] = origin_empty
         
         # Create trail if specified
         if self.config.projectile_trail_length > 0:
@@ -41,101 +110,35 @@ class ProjectileShot:
         
         return projectile_obj
 
-    def _apply_projectile_material(self, projectile_obj):
-        """Apply material to the projectile"""
-        mat_name = "SpiderProjectile_Material"
-        
-        if mat_name in bpy.data.materials:
-            material = bpy.data.materials[mat_name]
-        else:
-            material = bpy.data.materials.new(name=mat_name)
-            material.use_nodes = True
-            nodes = material.node_tree.nodes
-            nodes.clear()
-            
-            # Create emission shader for glowing effect
-            emission = nodes.new(type='ShaderNodeEmission')
-            emission.inputs['Color'].default_value = (0.9, 0.9, 1.0, 1.0)  # Slightly blue-white
-            emission.inputs['Strength'].default_value = 2.0
-            
-            # Add some transparency
-            transparent = nodes.new(type='ShaderNodeBsdfTransparent')
-            mix = nodes.new(type='ShaderNodeMixShader')
-            mix.inputs['Fac'].default_value = 0.3  # 30% transparent
-            
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            
-            # Connect nodes
-            material.node_tree.links.new(transparent.outputs['BSDF'], mix.inputs[1])
-            material.node_tree.links.new(emission.outputs['Emission'], mix.inputs[2])
-            material.node_tree.links.new(mix.outputs['Shader'], output.inputs['Surface'])
-        
-        # Assign material
-        projectile_obj.data.materials.append(material)
-
     def _create_projectile_trail(self, context, origin_empty, target_empty):
         """Create a trail effect for the projectile"""
         
-        # Create a cylinder for the trail
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=self.config.projectile_size * 0.3,
-            depth=self.config.projectile_trail_length,
-            location=origin_empty.location
+        # Create a cylinder for the trail (the unit cylinder is 2 deep), shared between trails
+        # of the same size. The trail is thin and fades out along its length, so 8 sides read the
+        # same as a full 32-sided cylinder
+        co, loop_totals, vertex_indices = unit_cylinder(8)
+        radius = self.config.projectile_size * 0.3
+        half_length = self.config.projectile_trail_length * 0.5
+        mesh = get_shared_mesh(
+            ("SpiderProjectileTrail", radius, half_length),
+            lambda: new_mesh(
+                "SpiderProjectileTrail",
+                co * np.array((radius, radius, half_length), dtype=np.float32),
+                loop_totals, vertex_indices,
+                get_material("SpiderTrail_Material", _build_trail_material)
+            )
         )
         
-        trail_obj = context.active_object
-        trail_obj.name = "SpiderProjectileTrail"
+        trail_obj = bpy.data.objects.new("SpiderProjectileTrail", mesh)
+        context.collection.objects.link(trail_obj)
+        trail_obj.location = origin_empty.location
         
-        # Store reference
+        # Store reference, tagged with the web's origin like the projectile
         self.trail_mesh = trail_obj
-        
-        # Apply trail material
-        self._apply_trail_material(trail_obj)
+        trail_obj["origin_empty"] = origin_empty
         
         return trail_obj
 
-    def _apply_trail_material(self, trail_obj):
-        """Apply material to the projectile trail"""
-        mat_name = "SpiderTrail_Material"
-        
-        if mat_name in bpy.data.materials:
-            material = bpy.data.materials[mat_name]
-        else:
-            material = bpy.data.materials.new(name=mat_name)
-            material.use_nodes = True
-            material.blend_method = 'BLEND'  # Enable transparency
-            
-            nodes = material.node_tree.nodes
-            nodes.clear()
-            
-            # Create emission shader with gradient
-            emission = nodes.new(type='ShaderNodeEmission')
-            emission.inputs['Color'].default_value = (0.7, 0.7, 1.0, 1.0)  # Light blue
-            emission.inputs['Strength'].default_value = 1.0
-            
-            # Add transparency with gradient
-            transparent = nodes.new(type='ShaderNodeBsdfTransparent')
-            
-            # Color ramp for gradient effect
-            color_ramp = nodes.new(type='ShaderNodeValToRGB')
-            color_ramp.color_ramp.elements[0].color = (1, 1, 1, 0)  # Transparent
-            color_ramp.color_ramp.elements[1].color = (1, 1, 1, 1)  # Opaque
-            
-            # Texture coordinate for gradient
-            tex_coord = nodes.new(type='ShaderNodeTexCoord')
-            
-            mix = nodes.new(type='ShaderNodeMixShader')
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            
-            # Connect nodes for gradient transparency
-            material.node_tree.links.new(tex_coord.outputs['Generated'], color_ramp.inputs['Fac'])
-            material.node_tree.links.new(color_ramp.outputs['Alpha'], mix.inputs['Fac'])
-            material.node_tree.links.new(transparent.outputs['BSDF'], mix.inputs[1])
-            material.node_tree.links.new(emission.outputs['Emission'], mix.inputs[2])
-            material.node_tree.links.new(mix.outputs['Shader'], output.inputs['Surface'])
-        
-        # Assign material
-        trail_obj.data.materials.append(material)
 
     def animate_shot(self, context, origin_empty, target_empty, start_frame=1):
         """Animate the projectile shot from origin to target"""
@@ -151,74 +154,67 @@ class ProjectileShot:
         projectile_obj = self.shot_mesh
         
         # Clear existing animation data
-        if projectile_obj.animation_data:
+        if projectile_obj.animation_data is not None:
             projectile_obj.animation_data_clear()
         
         # Convert shoot_time from seconds to frames
-        scene = context.scene
-        fps = scene.render.fps / scene.render.fps_base
-        duration_frames = int(self.config.shoot_time * fps)
-        end_frame = start_frame + duration_frames
-        
-        # Set up initial position at origin
-        projectile_obj.location = origin_empty.location
-        
-        # Set keyframes for position animation
-        projectile_obj.keyframe_insert(data_path="location", frame=start_frame)
+        render = context.scene.render
+        fps = render.fps / render.fps_base
+        end_frame = start_frame + int(self.config.shoot_time * fps)
         
-        # Set final position at target
+        # Key the flight from origin to target in one go, leaving the projectile at the target.
+        # LINEAR interpolation for steady movement ('BEZIER' would ease in and out)
         projectile_obj.location = target_empty.location
-        projectile_obj.keyframe_insert(data_path="location", frame=end_frame)
-        
-        # Set up interpolation for smooth movement
-        if projectile_obj.animation_data and projectile_obj.animation_data.action:
-            for fcurve in projectile_obj.animation_data.action.fcurves:
-                for keyframe in fcurve.keyframe_points:
-                    keyframe.interpolation = 'LINEAR'  # or 'BEZIER' for more natural movement
+        insert_keyframes(
+            projectile_obj, "location", (start_frame, end_frame),
+            (origin_empty.location[:], target_empty.location[:]),
+            interpolation='LINEAR'
+        )
          
         # Animate trail if enabled
-        if hasattr(self, 'trail_mesh') and self.trail_mesh:
+        if self.trail_mesh:
             self._animate_projectile_trail(context, origin_empty, target_empty, start_frame, end_frame, fps)
 
     def _animate_projectile_trail(self, context, origin_empty, target_empty, start_frame, end_frame, fps):
         """Animate the projectile trail effect"""
-        if not hasattr(self, 'trail_mesh') or not self.trail_mesh:
+        if not self.trail_mesh:
             return
         
         trail_obj = self.trail_mesh
         
         # Clear existing animation
-        if trail_obj.animation_data:
+        if trail_obj.animation_data is not None:
             trail_obj.animation_data_clear()
         
         # Calculate trail positions
-        origin_pos = Vector(origin_empty.location)
-        target_pos = Vector(target_empty.location)
-        direction = (target_pos - origin_pos).normalized()
+        origin_pos = np.array(origin_empty.location)
+        offset = np.array(target_empty.location) - origin_pos
+        distance = np.linalg.norm(offset)
+        direction = offset / distance if distance > 0 else np.zeros(3)
         
-        # Trail starts invisible
-        trail_obj.scale = (0.0, 0.0, 0.0)
-        trail_obj.keyframe_insert(data_path="scale", frame=start_frame)
-        
-        # Trail grows as projectile moves
-        for i in range(5):  # 5 intermediate positions
-            frame = start_frame + int((end_frame - start_frame) * (i + 1) / 6)
-            progress = (i + 1) / 6
-            
-            # Position trail behind the projectile
-            trail_length = self.config.projectile_trail_length * progress
-            trail_position = origin_pos + direction * (target_pos - origin_pos).length * progress
-            trail_obj.location = trail_position - direction * trail_length * 0.5
-            
-            # Scale trail based on progress
-            scale_factor = min(1.0, progress * 2)  # Grows quickly then stabilizes
-            trail_obj.scale = (scale_factor, scale_factor, trail_length)
-            
-            trail_obj.keyframe_insert(data_path="location", frame=frame)
-            trail_obj.keyframe_insert(data_path="scale", frame=frame)
-        
-        # Trail fades after impact (0.4 seconds after impact)
+        # Trail grows as projectile moves, over 5 intermediate positions computed together
+        steps = np.arange(1, 6)
+        progress = steps / 6
+        location_frames = start_frame + (end_frame - start_frame) * steps // 6
+        
+        # Position trail behind the projectile
+        trail_lengths = self.config.projectile_trail_length * progress
+        locations = origin_pos + offset * progress[:, None] - direction * (trail_lengths * 0.5)[:, None]
+        
+        # Scale trail based on progress; it grows quickly then stabilizes
+        scale_factors = np.minimum(1.0, progress * 2)
+        
+        # Trail starts invisible and fades after impact (0.4 seconds after impact)
         fade_duration = 0.4  # seconds
         fade_frame = end_frame + int(fade_duration * fps)
+        scale_frames = np.concatenate(((start_frame,), location_frames, (fade_frame,)))
+        scales = np.zeros((len(scale_frames), 3))
+        scales[1:-1, 0] = scale_factors
+        scales[1:-1, 1] = scale_factors
+        scales[1:-1, 2] = trail_lengths
+        
+        # Write all the keys of each channel at once, leaving the trail as it ends
+        trail_obj.location = locations[-1]
         trail_obj.scale = (0.0, 0.0, 0.0)
-        trail_obj.keyframe_insert(data_path="scale", frame=fade_frame)
\ No newline at end of file
+        insert_keyframes(trail_obj, "location", location_frames, locations)
+        insert_keyframes(trail_obj, "scale", scale_frames, scales)
\ No newline at end of file
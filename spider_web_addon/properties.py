@@ -1,10 +1,17 @@
 import bpy
-from bpy.props import FloatProperty, IntProperty, BoolProperty
+from bpy.app.handlers import persistent
+from dataclasses import fields
+from bpy.props import FloatProperty, FloatVectorProperty, IntProperty, BoolProperty
 from bpy.types import PropertyGroup
-from mathutils import Vector
 
 from .config import SpiderWebConfig, SpiderShotConfig, SpiderSpreadConfig
 
+# Config fields copied to and from the property groups of the same names
+_SHOT_FIELDS = tuple(f.name for f in fields(SpiderShotConfig))
+_SPREAD_FIELDS = tuple(f.name for f in fields(SpiderSpreadConfig))
+_TETHER_FIELDS = frozenset(("tether_width", "tether_slack"))
+_PROJECTILE_FIELDS = frozenset(("projectile_size", "projectile_trail_length"))
+
 class SpiderShotProperties(PropertyGroup):
     shoot_time: FloatProperty(
         name="Shoot Time",
@@ -145,89 +152,59 @@ class SpiderWebProperties(PropertyGroup):
     )
     
     # Coordinate properties
-    origin_x: FloatProperty(
-        name="Origin X",
-        description="X coordinate of web origin",
-        default=0.0,
-        precision=3
-    )
-    origin_y: FloatProperty(
-        name="Origin Y", 
-        description="Y coordinate of web origin",
-        default=0.0,
-        precision=3
-    )
-    origin_z: FloatProperty(
-        name="Origin Z",
-        description="Z coordinate of web origin", 
-        default=0.0,
+    origin: FloatVectorProperty(
+        name="Origin",
+        description="Coordinates of web origin",
+        size=3,
+        subtype='TRANSLATION',
+        default=(0.0, 0.0, 0.0),
         precision=3
     )
     
-    target_x: FloatProperty(
-        name="Target X",
-        description="X coordinate of web target",
-        default=2.0,
-        precision=3
-    )
-    target_y: FloatProperty(
-        name="Target Y",
-        description="Y coordinate of web target",
-        default=0.0,
-        precision=3
-    )
-    target_z: FloatProperty(
-        name="Target Z",
-        description="Z coordinate of web target",
-        default=0.0,
+    target: FloatVectorProperty(
+        name="Target",
+        description="Coordinates of web target",
+        size=3,
+        subtype='TRANSLATION',
+        default=(2.0, 0.0, 0.0),
         precision=3
     )
 
+    # TRANSLATION vector properties already read back as a Vector tied to the property; copy it
+    # in one call rather than rebuilding it component by component, so later edits in the panel
+    # don't move a web that holds on to it
     @property
     def origin_vector(self):
-        """Get origin as Vector"""
-        return Vector((self.origin_x, self.origin_y, self.origin_z))
+        """Get origin as a detached Vector"""
+        return self.origin.copy()
     
     @property 
     def target_vector(self):
-        """Get target as Vector"""
-        return Vector((self.target_x, self.target_y, self.target_z))
+        """Get target as a detached Vector"""
+        return self.target.copy()
     
     def set_origin(self, location):
         """Set origin from Vector or tuple"""
-        self.origin_x = location[0]
-        self.origin_y = location[1] 
-        self.origin_z = location[2]
+        # One write of all three components through the vector property
+        self.origin = location
     
     def set_target(self, location):
         """Set target from Vector or tuple"""
-        self.target_x = location[0]
-        self.target_y = location[1]
-        self.target_z = location[2]
+        self.target = location
 
     def to_config(self):
         """Convert Blender properties back to config dataclass"""
-        shot_config = SpiderShotConfig(
-            shoot_time=self.shot_props.shoot_time,
-            is_target_parent=self.shot_props.is_target_parent,
-            is_tethered=self.shot_props.is_tethered,
-            tether_width=self.shot_props.tether_width if self.shot_props.is_tethered else None,
-            tether_slack=self.shot_props.tether_slack if self.shot_props.is_tethered else None,
-            projectile_size=self.shot_props.projectile_size if not self.shot_props.is_tethered else None,
-            projectile_trail_length=self.shot_props.projectile_trail_length if not self.shot_props.is_tethered else None,
-        )
+        shot_props = self.shot_props
+        spread_props = self.spread_props
         
-        spread_config = SpiderSpreadConfig(
-            radius=self.spread_props.radius,
-            height=self.spread_props.height,
-            spread_time=self.spread_props.spread_time,
-            density_spoke=self.spread_props.density_spoke,
-            density_rib=self.spread_props.density_rib,
-            web_thickness=self.spread_props.web_thickness,
-            curvature=self.spread_props.curvature,
-            random_spread_edge=self.spread_props.random_spread_edge,
-            random_spread_interior=self.spread_props.random_spread_interior,
-        )
+        # Settings of the other shot type are left unset
+        unused_fields = _PROJECTILE_FIELDS if shot_props.is_tethered else _TETHER_FIELDS
+        shot_config = SpiderShotConfig(**{
+            name: None if name in unused_fields else getattr(shot_props, name)
+            for name in _SHOT_FIELDS
+        })
+        
+        spread_config = SpiderSpreadConfig(**{name: getattr(spread_props, name) for name in _SPREAD_FIELDS})
         
         return SpiderWebConfig(
             spider_shot_config=shot_config,
@@ -238,27 +215,31 @@ class SpiderWebProperties(PropertyGroup):
     
     def from_config(self, config: SpiderWebConfig):
         """Load config dataclass into Blender properties"""
-        # Shot properties
-        self.shot_props.shoot_time = config.spider_shot_config.shoot_time
-        self.shot_props.is_target_parent = config.spider_shot_config.is_target_parent
-        self.shot_props.is_tethered = config.spider_shot_config.is_tethered
-        
-        if config.spider_shot_config.tether_width is not None:
-            self.shot_props.tether_width = config.spider_shot_config.tether_width
-        if config.spider_shot_config.tether_slack is not None:
-            self.shot_props.tether_slack = config.spider_shot_config.tether_slack
-        if config.spider_shot_config.projectile_size is not None:
-            self.shot_props.projectile_size = config.spider_shot_config.projectile_size
-        if config.spider_shot_config.projectile_trail_length is not None:
-            self.shot_props.projectile_trail_length = config.spider_shot_config.projectile_trail_length
+        # Shot properties; unset optional ones keep their current values
+        shot_props = self.shot_props
+        shot_config = config.spider_shot_config
+        for name in _SHOT_FIELDS:
+            value = getattr(shot_config, name)
+            if value is not None:
+                setattr(shot_props, name, value)
         
         # Spread properties
-        self.spread_props.radius = config.spider_spread_config.radius
-        self.spread_props.height = config.spider_spread_config.height
-        self.spread_props.spread_time = config.spider_spread_config.spread_time
-        self.spread_props.density_spoke = config.spider_spread_config.density_spoke
-        self.spread_props.density_rib = config.spider_spread_config.density_rib
-        self.spread_props.web_thickness = config.spider_spread_config.web_thickness
-        self.spread_props.curvature = config.spider_spread_config.curvature
-        self.spread_props.random_spread_edge = config.spider_spread_config.random_spread_edge
-        self.spread_props.random_spread_interior = config.spider_spread_config.random_spread_interior
\ No newline at end of file
+        spread_props = self.spread_props
+        spread_config = config.spider_spread_config
+        for name in _SPREAD_FIELDS:
+            setattr(spread_props, name, getattr(spread_config, name))
+
+@persistent
+def migrate_legacy_coordinates(*args):
+    """Move panel coordinates saved as origin_x/y/z and target_x/y/z into the vector properties (load_post handler and one-shot timer)"""
+    for scene in bpy.data.scenes:
+        props = scene.spider_web_props
+        for name in ("origin", "target"):
+            # pop() so the stale values are only carried over once, not on every later load
+            legacy = [props.pop(f"{name}_{axis}", None) for axis in "xyz"]
+            if any(value is not None for value in legacy):
+                current = getattr(props, name)
+                setattr(props, name, [
+                    value if value is not None else current_value
+                    for value, current_value in zip(legacy, current)
+                ])
@@ -1,19 +1,101 @@
 import bpy
-import bmesh
 import math
-import random
-from dataclasses import dataclass, field
+import numpy as np
+from functools import lru_cache
 from typing import Tuple, Optional, Dict, List
 from mathutils import Vector, Matrix
-import threading
-from concurrent.futures import ThreadPoolExecutor
-import time
 from .utils import *
 from .config import *
 from .node_graphs import *
 
+def _fit_random_offsets(offsets, shape):
+    """Return the random offsets as a float array of the given shape, zero-filled where they don't reach"""
+    fitted = np.zeros(shape)
+    if offsets is not None:
+        offsets = np.asarray(offsets, dtype=np.float64)
+        rows = min(shape[0], offsets.shape[0])
+        cols = min(shape[1], offsets.shape[1])
+        fitted[:rows, :cols] = offsets[:rows, :cols]
+    return fitted
+
+def _normalized_rows(vectors):
+    """Normalize each row of an (N, 3) array, leaving zero-length rows at zero like Vector.normalized()"""
+    lengths = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors, lengths, out=np.zeros_like(vectors), where=lengths > 0)
+
+@lru_cache(maxsize=None)
+def _spoke_unit_directions(density_spoke):
+    """Cached (cos, sin) of every spoke angle for a given spoke density"""
+    angles = (2 * math.pi / density_spoke) * np.arange(density_spoke)
+    directions = np.stack((np.cos(angles), np.sin(angles)))
+    directions.flags.writeable = False
+    return directions
+
+@lru_cache(maxsize=None)
+def _rib_curve_parameters(density_rib):
+    """Cached rib parameters t along a spoke and their unscaled parabolic curve factors (t^2 - t) * 4 / 2"""
+    t = np.arange(1, density_rib + 1) / density_rib
+    curve = (t * t - t) * 2.0
+    t.flags.writeable = False
+    curve.flags.writeable = False
+    return t, curve
+
+def compute_spread_points(origin, web_center, rotation, radius, height, curvature, edge_random, interior_random):
+    """
+    Compute the world-space spoke end and rib positions of a web spread
+    
+    Args:
+        origin: Web origin position, used as the reference for curve direction
+        web_center: Web center position
+        rotation: 3x3 rotation aligning the web's local Z axis with the shot direction
+        radius: Radius of the spread
+        height: Height offset of the spoke ends along the local Z axis
+        curvature: Amount of curvature of the spokes
+        edge_random: (density_spoke, 2) local XY offsets applied to the spoke ends
+        interior_random: (density_spoke, density_rib) offsets applied along each spoke
+    
+    Returns:
+        tuple: (density_spoke, 3) spoke positions and (density_spoke, density_rib, 3) rib positions
+    """
+    density_spoke, density_rib = interior_random.shape
+    
+    # Spoke end offsets in the web's local space, with edge randomness applied
+    cos_angles, sin_angles = _spoke_unit_directions(density_spoke)
+    local_offsets = np.empty((density_spoke, 3))
+    local_offsets[:, 0] = radius * cos_angles + edge_random[:, 0]
+    local_offsets[:, 1] = radius * sin_angles + edge_random[:, 1]
+    local_offsets[:, 2] = height
+    
+    # Rotate every spoke offset into world space with a single matrix multiply
+    center = np.asarray(web_center, dtype=np.float64)
+    spoke_positions = center + local_offsets @ np.asarray(rotation, dtype=np.float64).T
+    
+    # Place the ribs along each spoke using the same parabolic curve as the node graph:
+    # lerp from center to spoke end, pushed away from the origin by (t^2 - t) * 4 * curvature / 2
+    t, rib_curve = _rib_curve_parameters(density_rib)
+    spoke_vectors = spoke_positions - center
+    midpoints = (center + spoke_positions) * 0.5
+    curve_directions = _normalized_rows(np.asarray(origin, dtype=np.float64) - midpoints)
+    curve_factors = rib_curve * curvature
+    rib_positions = (
+        center
+        + spoke_vectors[:, None, :] * t[None, :, None]
+        - curve_directions[:, None, :] * curve_factors[None, :, None]
+    )
+    
+    # Apply interior randomness along the spoke axis
+    spoke_directions = _normalized_rows(spoke_vectors)
+    rib_positions += spoke_directions[:, None, :] * interior_random[:, :, None]
+    
+    return spoke_positions, rib_positions
+
 class SpiderSpread:    
     """The the web spread at the target"""
+    __slots__ = (
+        'origin', 'target', 'config', 'web_center', 'web_spokes_ribs', 'mesh_objs',
+        'edge_random_offsets', 'interior_random_offsets', 'spread_sphere', 'rib_positions',
+    )
+
     def __init__(self, origin: Tuple[float, float, float], target: Tuple[float, float, float], config: SpiderSpreadConfig = None):
         self.origin = origin
         self.target = target
@@ -25,155 +107,202 @@ class SpiderSpread:
 
         # Mesh Objs
         self.mesh_objs = []
+        self.spread_sphere = None
+        self.rib_positions = None  # (density_spoke, density_rib, 3) world positions of the ribs
         
         # Store random values for consistency
-        self.edge_random_offsets = {}  # spoke_index -> (x_offset, y_offset)
-        self.interior_random_offsets = {}  # (spoke_index, rib_index) -> offset_amount
+        self.edge_random_offsets = None  # (density_spoke, 2) local XY offsets of the spoke ends
+        self.interior_random_offsets = None  # (density_spoke, density_rib) offsets along each spoke
 
     def generate_random_values(self):
         """Pre-generate all random values for consistent results - only if not already loaded"""
         # Only generate if we don't already have random values loaded
-        if not self.edge_random_offsets and not self.interior_random_offsets:
-            # Generate edge randomness for each spoke
-            for i in range(self.config.density_spoke):
-                # Random offset in local X,Y plane (0 to edge_randomness)
-                x_offset = random.uniform(0, self.config.random_spread_edge)
-                y_offset = random.uniform(0, self.config.random_spread_edge)
-                # Apply random sign
-                x_offset *= random.choice([-1, 1])
-                y_offset *= random.choice([-1, 1])
-                self.edge_random_offsets[i] = (x_offset, y_offset)
-            
-            # Generate interior randomness for each rib
-            for i in range(self.config.density_spoke):
-                for j in range(self.config.density_rib):
-                    # Random offset along spoke axis (0 to interior_randomness)
-                    offset = random.uniform(0, self.config.random_spread_interior)
-                    # Apply random sign (can move toward or away from center)
-                    offset *= random.choice([-1, 1])
-                    self.interior_random_offsets[(i, j)] = offset
+        if self.edge_random_offsets is None and self.interior_random_offsets is None:
+            density_spoke = self.config.density_spoke
+            density_rib = self.config.density_rib
+            
+            # Edge randomness for each spoke: offset in local X,Y plane (0 to edge_randomness) with a random sign
+            self.edge_random_offsets = (
+                np.random.uniform(0, self.config.random_spread_edge, (density_spoke, 2))
+                * np.random.choice((-1.0, 1.0), (density_spoke, 2))
+            )
+            
+            # Interior randomness for each rib: offset along spoke axis (0 to interior_randomness),
+            # signed so it can move toward or away from center
+            self.interior_random_offsets = (
+                np.random.uniform(0, self.config.random_spread_interior, (density_spoke, density_rib))
+                * np.random.choice((-1.0, 1.0), (density_spoke, density_rib))
+            )
 
-    def calculate_curved_position(self, start_pos, end_pos, reference_pos, t, curve_amount):
-        """
-        Calculate the curved position along a line using the same formula as the node graph
+    def calculate_spread_points(self):
+        """Compute the web center, spoke and rib positions for the current origin, target and random values"""
+        # Calculate actual web center offset
+        web_center_vec = get_point_offset_from_end(self.origin, self.target, self.config.height)
         
-        Args:
-            start_pos: Starting position (Vector)
-            end_pos: Ending position (Vector)
-            reference_pos: Reference position for curve direction (Vector)
-            t: Parameter from 0.0 to 1.0 along the curve
-            curve_amount: Amount of curvature
+        density_spoke = self.config.density_spoke
+        density_rib = self.config.density_rib
         
-        Returns:
-            Vector: The curved position at parameter t
-        """
-        # Linear interpolation between start and end
-        linear_pos = start_pos.lerp(end_pos, t)
+        # Get the direction of the web
+        web_direction = (Vector(self.target) - Vector(self.origin)).normalized()
         
-        # Calculate midpoint between start and end
-        midpoint = (start_pos + end_pos) * 0.5
+        # Rotation matrix for aligning the web in the correct direction
+        rotation_matrix = web_direction.to_track_quat('Z', 'Y').to_matrix()
         
-        # Calculate direction from midpoint to reference point
-        direction = (reference_pos - midpoint).normalized()
+        # Fit the random values to the current densities (missing entries contribute no offset)
+        edge_random = _fit_random_offsets(self.edge_random_offsets, (density_spoke, 2))
+        interior_random = _fit_random_offsets(self.interior_random_offsets, (density_spoke, density_rib))
         
-        # Parabolic curve formula: t^2 - t, scaled by 4, gives peak at t=0.5
-        curve_factor = ((t * t - t) * 4.0 * curve_amount) * 0.5
+        # Compute all spoke and rib positions in one pass
+        spoke_positions, rib_positions = compute_spread_points(
+            self.origin, web_center_vec, rotation_matrix,
+            self.config.radius, self.config.height, self.config.curvature, edge_random, interior_random
+        )
         
-        # Apply curve offset
-        curved_pos = linear_pos - (direction * curve_factor)
+        # Keep the rib positions so the animation doesn't have to read them back from every empty
+        self.rib_positions = rib_positions
         
-        return curved_pos
+        # Convert to nested float lists in one bulk call rather than indexing numpy rows per empty
+        return web_center_vec, spoke_positions.tolist(), rib_positions.tolist()
 
     def create_spread(self, origin_empty, target_empty):
         """Creates the control points for the web spread"""
         # Generate random values if not already loaded (preserves existing values)
         self.generate_random_values()
         
-        # Calculate actual web center offset
-        web_center_vec = get_point_offset_from_end(self.origin, self.target, self.config.height)
+        web_center_vec, spoke_points, rib_points = self.calculate_spread_points()
         
-        # Create web center point
-        self.web_center = create_control_point(web_center_vec, "WebCenter", target_empty)
+        # Create web center point (linked together with the spokes and ribs below)
+        self.web_center = create_control_point(web_center_vec, "WebCenter", target_empty, link=False)
         
-        # Radially create the points
-        radius = self.config.radius
-        height = self.config.height
         density_spoke = self.config.density_spoke
         density_rib = self.config.density_rib
         
-        # Get the direction of the web
-        web_direction = (Vector(self.target) - Vector(self.origin)).normalized()
+        # Build all control point names up front, outside the creation loop
+        spoke_names = [f"WebSpoke_{i}" for i in range(density_spoke)]
+        rib_names = [[f"WebRib_{i}-{j}" for j in range(1, density_rib + 1)] for i in range(density_spoke)]
         
-        # Rotation matrix for aligning the web in the correct direction
-        rotation_matrix = web_direction.to_track_quat('Z', 'Y').to_matrix().to_4x4()
+        # Invert each parent's world matrix once and share it with all of its children
+        web_center_inverse = get_parent_inverse(self.web_center)
         
-        # Calculate step angle for the spoke density
-        spoke_step = (2 * math.pi) / density_spoke
-        rib_step = radius / density_rib
-        
-        # Convert positions to vectors for curve calculation
-        origin_vec = Vector(self.origin)
-        web_center_vector = Vector(web_center_vec)
+        # Build every spoke and rib unlinked, then link them to the scene together
+        control_points = [self.web_center]
         
         for i in range(density_spoke):
-            # Create spoke point
-            angle = spoke_step * i
-
-            offset = Vector((
-                radius * math.cos(angle),
-                radius * math.sin(angle),
-                height
-            ))
-            
-            # Apply edge randomness to the spoke endpoint
-            if i in self.edge_random_offsets:
-                x_rand, y_rand = self.edge_random_offsets[i]
-                # Apply randomness in local coordinate system
-                random_offset = Vector((x_rand, y_rand, 0))
-                offset += random_offset
-
-            world_offset = rotation_matrix @ offset
-            spoke_position = web_center_vec + world_offset
-
-            spoke_empty = create_control_point(spoke_position, f"WebSpoke_{i}", self.web_center)
+            spoke_empty = create_control_point(spoke_points[i], spoke_names[i], self.web_center, web_center_inverse, link=False)
+            spoke_inverse = get_parent_inverse(spoke_empty)
+            control_points.append(spoke_empty)
 
             rib_empties = []
-            for j in range(1, density_rib + 1):
-                # Calculate parameter t along the spoke (0.0 at center, 1.0 at spoke end)
-                t = j / density_rib
-                
-                # Calculate the curved position along the spoke using the same formula as the node graph
-                curved_position = self.calculate_curved_position(
-                    web_center_vector,  # Start position (web center)
-                    Vector(spoke_position),  # End position (spoke end)
-                    origin_vec,  # Reference position (origin for curve direction)
-                    t,  # Parameter along curve
-                    self.config.curvature  # Curve amount
-                )
-                
-                # Apply interior randomness along the spoke axis
-                if (i, j-1) in self.interior_random_offsets:  # j-1 because we start from 1
-                    interior_offset = self.interior_random_offsets[(i, j-1)]
-                    # Calculate spoke direction (from center to spoke end)
-                    spoke_direction = (Vector(spoke_position) - web_center_vector).normalized()
-                    # Apply offset along spoke direction
-                    curved_position += spoke_direction * interior_offset
-
-                rib_empty = create_control_point(curved_position, f"WebRib_{i}-{j}", spoke_empty)
+            for j in range(density_rib):
+                rib_empty = create_control_point(rib_points[i][j], rib_names[i][j], spoke_empty, spoke_inverse, link=False)
                 rib_empties.append(rib_empty)
+            control_points.extend(rib_empties)
 
             # Store spoke -> ribs mapping
             self.web_spokes_ribs[spoke_empty] = rib_empties
+        
+        link = bpy.context.collection.objects.link
+        for control_point in control_points:
+            link(control_point)
     
     
 
-    def create_rib_meshes(self, context, origin_empty, target_empty):
+    def relocate_spread(self, target_empty, web_empties):
+        """Move an existing spread's control points to match the current origin and target.
+        
+        The strands are driven by these empties through their modifiers, so they follow without
+        being rebuilt. Returns False, leaving everything untouched, if the existing empties don't
+        match this spread's spoke and rib counts.
+        """
+        density_spoke = self.config.density_spoke
+        density_rib = self.config.density_rib
+        
+        # Read every empty's name and parent once, bucketing the empties by parent in one pass
+        children = {}
+        for empty in web_empties:
+            children.setdefault(empty.parent, []).append((empty.name.split(".", 1)[0], empty))
+        
+        # Pick out this web's center, spokes and ribs by parent, indexing them from their names
+        web_center = next((empty for name, empty in children.get(target_empty, ()) if name == "WebCenter"), None)
+        if web_center is None:
+            return False
+        
+        spokes = {}
+        for name, empty in children.get(web_center, ()):
+            if name[:9] == "WebSpoke_" and name[9:].isdigit():
+                spokes[empty] = int(name[9:])
+        
+        ribs = {}
+        for spoke_empty, spoke_index in spokes.items():
+            for name, empty in children.get(spoke_empty, ()):
+                if name[:7] == "WebRib_":
+                    rib_part = name[7:].rpartition("-")[2]
+                    if rib_part.isdigit():
+                        ribs[(spoke_index, int(rib_part) - 1)] = empty
+        
+        spoke_by_index = {index: spoke for spoke, index in spokes.items()}
+        if (sorted(spoke_by_index) != list(range(density_spoke))
+                or len(ribs) != density_spoke * density_rib
+                or any((i, j) not in ribs for i in range(density_spoke) for j in range(density_rib))):
+            return False
+        
+        self.generate_random_values()
+        web_center_vec, spoke_points, rib_points = self.calculate_spread_points()
+        
+        # Parents first, so each child is placed relative to its parent's new transform. Each parent
+        # inverse is reset to the parent's current one, as create_control_point sets it, so every
+        # empty's location stays equal to its world position after the move
+        web_center.matrix_parent_inverse = get_parent_inverse(target_empty)
+        web_center.matrix_world = Matrix.Translation(web_center_vec)
+        web_center_inverse = get_parent_inverse(web_center)
+        self.web_center = web_center
+        self.web_spokes_ribs = {}
+        for i in range(density_spoke):
+            spoke_empty = spoke_by_index[i]
+            spoke_empty.matrix_parent_inverse = web_center_inverse
+            spoke_empty.matrix_world = Matrix.Translation(spoke_points[i])
+            spoke_inverse = get_parent_inverse(spoke_empty)
+            
+            rib_empties = []
+            for j in range(density_rib):
+                rib_empty = ribs[(i, j)]
+                rib_empty.matrix_parent_inverse = spoke_inverse
+                rib_empty.matrix_world = Matrix.Translation(rib_points[i][j])
+                rib_empties.append(rib_empty)
+            self.web_spokes_ribs[spoke_empty] = rib_empties
+        
+        return True
+
+    def component_objects(self):
+        """The control empties and strand objects making up this spread"""
+        objects = [self.web_center] if self.web_center is not None else []
+        for spoke_empty, rib_empties in self.web_spokes_ribs.items():
+            objects.append(spoke_empty)
+            objects.extend(rib_empties)
+        objects.extend(self.mesh_objs)
+        if self.spread_sphere is not None:
+            objects.append(self.spread_sphere)
+        return objects
+
+    def create_rib_meshes(self, context, origin_empty, target_empty, strand_mesh=None):
         """Create the rib curves that connect between spokes"""
         web_curve_node_tree = create_web_curve_node_tree()
         
+        # Strand geometry is generated by the node tree, so every strand object can share one empty mesh
+        if strand_mesh is None:
+            strand_mesh = bpy.data.meshes.new("WebStrand")
+        
         # Get all spokes in order
         spokes = list(self.web_spokes_ribs.keys())
         
+        # Resolve everything the segment loop reuses once
+        new_object = bpy.data.objects.new
+        link = context.collection.objects.link
+        mesh_objs = self.mesh_objs
+        web_center = self.web_center
+        web_thickness = self.config.web_thickness
+        rib_curvature = self.config.curvature * 0.5  # Less curvature for ribs
+        
         # For each rib level (concentric circle)
         for rib_level in range(self.config.density_rib):
             # Collect all rib empties at this level from all spokes
@@ -192,13 +321,12 @@ class SpiderSpread:
                 end_rib = rib_points_at_level[next_i]
                 
                 # Create mesh object for this rib segment
-                mesh = bpy.data.meshes.new(f"WebRib_Level{rib_level}_Seg{i}")
-                obj = bpy.data.objects.new(f"WebRib_Level{rib_level}_Seg{i}", mesh)
-                context.collection.objects.link(obj)
-                self.mesh_objs.append(obj)
+                obj = new_object(f"WebRib_Level{rib_level}_Seg{i}", strand_mesh)
+                link(obj)
+                mesh_objs.append(obj)
                 
                 # Parent to origin
-                obj.parent = self.web_center
+                obj.parent = web_center
                 obj.parent_type = 'OBJECT'
                 
                 # Add geometry node modifier
@@ -208,28 +336,38 @@ class SpiderSpread:
                 # Set the inputs for the modifier
                 modifier["Socket_0"] = start_rib      # Start of rib segment
                 modifier["Socket_1"] = end_rib        # End of rib segment  
-                modifier["Socket_2"] = self.web_center # Web Origin (center point for curve calculation)
-                modifier["Socket_3"] = self.config.web_thickness
+                modifier["Socket_2"] = web_center # Web Origin (center point for curve calculation)
+                modifier["Socket_3"] = web_thickness
                 modifier["Socket_4"] = 50  # Curve resolution
-                modifier["Socket_5"] = self.config.curvature * 0.5  # Less curvature for ribs
+                modifier["Socket_5"] = rib_curvature
                 
                 obj.select_set(True)
 
     def create_mesh(self, context, origin_empty, target_empty):
         """Creates both spokes and ribs for spider web mesh"""
-        # Create the node tree (reuse if it exists)
+        # Get the shared node tree (built on first use)
         web_curve_node_tree = create_web_curve_node_tree()
         
+        # The node tree generates all strand geometry, so spokes and ribs share a single empty mesh
+        strand_mesh = bpy.data.meshes.new("WebStrand")
+        
+        # Resolve everything the spoke loop reuses once
+        new_object = bpy.data.objects.new
+        link = context.collection.objects.link
+        mesh_objs = self.mesh_objs
+        web_center = self.web_center
+        web_thickness = self.config.web_thickness
+        spoke_curvature = -1 * self.config.curvature
+        
         # Create spoke curves (your existing code)
         for i, spoke in enumerate(self.web_spokes_ribs):
             # Create object
-            mesh = bpy.data.meshes.new(f"WebSpoke_{i}")
-            obj = bpy.data.objects.new(f"WebSpoke_{i}", mesh)
-            context.collection.objects.link(obj)
-            self.mesh_objs.append(obj)
+            obj = new_object(f"WebSpoke_{i}", strand_mesh)
+            link(obj)
+            mesh_objs.append(obj)
 
             # Parent
-            obj.parent = self.web_center  # Changed from origin_empty to web_center
+            obj.parent = web_center  # Changed from origin_empty to web_center
             obj.parent_type = 'OBJECT'
 
             # Add geometry node modifier
@@ -237,20 +375,22 @@ class SpiderSpread:
             modifier.node_group = web_curve_node_tree
 
             # Set the inputs for the modifier
-            modifier["Socket_0"] = self.web_center
+            modifier["Socket_0"] = web_center
             modifier["Socket_1"] = spoke
             modifier["Socket_2"] = origin_empty
-            modifier["Socket_3"] = self.config.web_thickness
+            modifier["Socket_3"] = web_thickness
             modifier["Socket_4"] = 50 # Temp
-            modifier["Socket_5"] = -1 * self.config.curvature
+            modifier["Socket_5"] = spoke_curvature
 
             obj.select_set(True)
         
         # Create rib curves (new functionality)
-        self.create_rib_meshes(context, origin_empty, target_empty)
+        self.create_rib_meshes(context, origin_empty, target_empty, strand_mesh)
 
+        # Set the active object once, through the context the spread was built in, now that
+        # nothing reads it back mid-build
         if self.mesh_objs:
-            bpy.context.view_layer.objects.active = self.mesh_objs[-1]
+            context.view_layer.objects.active = self.mesh_objs[-1]
 
     def animate_spread(self, context, origin_empty, target_empty, starting_frame=1, frame_length_seconds=1):
         """Animate the web spreading from the inside out"""
@@ -259,12 +399,15 @@ class SpiderSpread:
         wm = context.window_manager
         
         # Calculate animation parameters
-        fps = context.scene.render.fps / context.scene.render.fps_base
+        render = context.scene.render
+        fps = render.fps / render.fps_base
         frame_length_frames = int(frame_length_seconds * fps)
         end_frame = starting_frame + frame_length_frames
         
         # Calculate total operations for progress tracking
-        spoke_meshes = [obj for obj in self.mesh_objs if "WebSpoke_" in obj.name and "WebRib_" not in obj.name]
+        # Spoke strands are named "WebSpoke_<i>" and rib strands "WebRib_Level...", so one prefix check
+        # separates them instead of two substring scans of every name
+        spoke_meshes = [obj for obj in self.mesh_objs if obj.name.startswith("WebSpoke_")]
         total_ribs = sum(len(rib_empties) for rib_empties in self.web_spokes_ribs.values())
         total_operations = 4 + len(spoke_meshes) + (total_ribs * 2)  # Base ops + booleans + rib keyframes
         
@@ -289,13 +432,7 @@ class SpiderSpread:
             start_position = self.target
             end_position = get_point_offset_from_end(self.origin, self.target, self.config.height)
             
-            context.scene.frame_set(starting_frame)
-            self.web_center.location = start_position
-            self.web_center.keyframe_insert(data_path="location", frame=starting_frame)
-            
-            context.scene.frame_set(end_frame)
-            self.web_center.location = end_position
-            self.web_center.keyframe_insert(data_path="location", frame=end_frame)
+            insert_keyframes(self.web_center, "location", (starting_frame, end_frame), (start_position[:3], end_position[:3]))
             
             current_progress += 1
             wm.progress_update(current_progress)
@@ -305,10 +442,11 @@ class SpiderSpread:
             
             sphere_radius_max = self.config.radius * 1.5
             
-            # Create low-poly sphere for better performance
-            bpy.ops.mesh.primitive_uv_sphere_add(location=(0,0,0))
-            sphere_obj = context.active_object
-            sphere_obj.name = "WebSpreadSphere"
+            # Build the sphere through bpy.data rather than the operator, which evaluates the scene
+            # and changes the active object mid-build; every web's sphere shares one unit mesh
+            sphere_mesh = get_shared_mesh(("WebSpreadSphere",), lambda: new_mesh("WebSpreadSphere", *unit_uv_sphere()))
+            sphere_obj = bpy.data.objects.new("WebSpreadSphere", sphere_mesh)
+            context.collection.objects.link(sphere_obj)
             sphere_obj.parent = self.web_center
             sphere_obj.parent_type = 'OBJECT'
             
@@ -317,13 +455,11 @@ class SpiderSpread:
             sphere_obj.hide_render = True
             
             # Animate sphere scale
-            context.scene.frame_set(starting_frame)
             sphere_obj.scale = (0.001, 0.001, 0.001)
-            sphere_obj.keyframe_insert(data_path="scale", frame=starting_frame)
-            
-            context.scene.frame_set(end_frame)
-            sphere_obj.scale = (sphere_radius_max, sphere_radius_max, sphere_radius_max)
-            sphere_obj.keyframe_insert(data_path="scale", frame=end_frame)
+            insert_keyframes(
+                sphere_obj, "scale", (starting_frame, end_frame),
+                ((0.001, 0.001, 0.001), (sphere_radius_max, sphere_radius_max, sphere_radius_max))
+            )
             
             current_progress += 1
             wm.progress_update(current_progress)
@@ -348,73 +484,41 @@ class SpiderSpread:
                     
                     current_progress += 1
                     wm.progress_update(current_progress)
-                    
-                    # Allow UI updates every few operations
-                    if (current_progress % 5) == 0:
-                        bpy.context.view_layer.update()
-                        # Force a minimal redraw without full viewport refresh
-                        for window in bpy.context.window_manager.windows:
-                            for area in window.screen.areas:
-                                if area.type == 'VIEW_3D':
-                                    area.tag_redraw()
-            
-            # Force view layer update after all booleans
-            bpy.context.view_layer.update()
             
             # 4. Animate ribs in optimized batches
             print(f"Animating {total_ribs} rib objects...")
             
             rib_batch_size = 5  # Process 5 ribs at a time
-            all_rib_data = []
-            
-            # Collect all rib animation data first
-            for spoke_empty, rib_empties in self.web_spokes_ribs.items():
-                for rib_empty in rib_empties:
-                    final_position = rib_empty.location.copy()
-                    web_center_pos = Vector(end_position)
-                    direction_to_final = (Vector(final_position) - web_center_pos).normalized()
-                    start_position_rib = web_center_pos + (direction_to_final * 0.01)
-                    
-                    all_rib_data.append({
-                        'rib': rib_empty,
-                        'start_pos': start_position_rib,
-                        'final_pos': final_position
-                    })
             
-            # Process ribs in batches
-            for i in range(0, len(all_rib_data), rib_batch_size):
-                batch = all_rib_data[i:i + rib_batch_size]
-                batch_num = i // rib_batch_size + 1
-                total_batches = (len(all_rib_data) + rib_batch_size - 1) // rib_batch_size
-                
-                print(f"Processing rib batch {batch_num}/{total_batches}")
+            # Compute every rib's start and final position in one vectorized step
+            rib_empties = [rib_empty for rib_list in self.web_spokes_ribs.values() for rib_empty in rib_list]
+            start_rows = final_rows = []
+            if rib_empties:
+                # Ribs are created with their world position as their location, so reuse the computed
+                # positions instead of reading every empty's location back through RNA
+                if self.rib_positions is not None and self.rib_positions.size == len(rib_empties) * 3:
+                    final_positions = self.rib_positions.reshape(-1, 3)
+                else:
+                    final_positions = np.array([rib_empty.location[:] for rib_empty in rib_empties], dtype=np.float64)
+                web_center_pos = np.asarray(end_position, dtype=np.float64)
+                start_positions = web_center_pos + _normalized_rows(final_positions - web_center_pos) * 0.01
+                start_rows = start_positions.tolist()
+                final_rows = final_positions.tolist()
+            
+            # Process ribs in batches, keying straight from the position rows
+            total_batches = (len(rib_empties) + rib_batch_size - 1) // rib_batch_size
+            for i in range(0, len(rib_empties), rib_batch_size):
+                batch_end = i + rib_batch_size
+                batch = rib_empties[i:batch_end]
                 
-                # Set starting keyframes for this batch
-                context.scene.frame_set(starting_frame)
-                for rib_data in batch:
-                    rib_data['rib'].location = rib_data['start_pos']
-                    rib_data['rib'].keyframe_insert(data_path="location", frame=starting_frame)
-                    
-                    current_progress += 1
-                    wm.progress_update(current_progress)
+                print(f"Processing rib batch {i // rib_batch_size + 1}/{total_batches}")
                 
-                # Set ending keyframes for this batch
-                context.scene.frame_set(end_frame)
-                for rib_data in batch:
-                    rib_data['rib'].location = rib_data['final_pos']
-                    rib_data['rib'].keyframe_insert(data_path="location", frame=end_frame)
-                    
-                    current_progress += 1
-                    wm.progress_update(current_progress)
+                # Key both ends of every rib in this batch, one bulk write per channel
+                for rib_empty, start_pos, final_pos in zip(batch, start_rows[i:batch_end], final_rows[i:batch_end]):
+                    insert_keyframes(rib_empty, "location", (starting_frame, end_frame), (start_pos, final_pos))
                 
-                # Allow UI updates between batches
-                if batch_num % 3 == 0:  # Every 3 batches
-                    bpy.context.view_layer.update()
-                    # Tag 3D viewport areas for redraw
-                    for window in bpy.context.window_manager.windows:
-                        for area in window.screen.areas:
-                            if area.type == 'VIEW_3D':
-                                area.tag_redraw()
+                current_progress += 2 * len(batch)
+                wm.progress_update(current_progress)
             
             # 5. Apply keyframe easing efficiently
             print("Applying keyframe easing...")
@@ -431,13 +535,6 @@ class SpiderSpread:
                             keyframe.interpolation = 'BEZIER'
                             keyframe.handle_left_type = 'AUTO'
                             keyframe.handle_right_type = 'AUTO'
-                    
-                    # Periodic UI updates during easing
-                    if i % (easing_batch_size * 5) == 0:
-                        for window in bpy.context.window_manager.windows:
-                            for area in window.screen.areas:
-                                if area.type == 'VIEW_3D':
-                                    area.tag_redraw()
             
             current_progress += 1
             wm.progress_update(current_progress)
@@ -458,135 +555,103 @@ class SpiderSpread:
                 context.space_data.shading.type = original_shading
             wm.progress_end()
             
-            # Set frame back to start
+            # Keys are written with explicit frames, so the scene only changes frame once,
+            # here, to evaluate everything keyed above at its starting pose. frame_set already
+            # updates the view layer, so no separate update follows
             context.scene.frame_set(starting_frame)
-            
-            # Final view layer update
-            bpy.context.view_layer.update()
 
-    def store_config_on_empty(self, empty):
-        """Store the spread configuration as custom properties on the empty"""
-        # Use Blender's proper custom property system with UI metadata
-        empty["spider_spread_radius"] = self.config.radius
-        empty.id_properties_ui("spider_spread_radius").update(
-            description="Radius of the web spread",
-            default=1.0,
-            min=0.01
-        )
-        
-        empty["spider_spread_height"] = self.config.height
-        empty.id_properties_ui("spider_spread_height").update(
-            description="Height variation of the web",
-            default=0.25,
-            min=0.0
-        )
-        
-        empty["spider_spread_spread_time"] = self.config.spread_time
-        empty.id_properties_ui("spider_spread_spread_time").update(
-            description="Time for web to spread out (in frames)",
-            default=1.0,
-            min=0.0
-        )
-        
-        empty["spider_spread_density_spoke"] = self.config.density_spoke
-        empty.id_properties_ui("spider_spread_density_spoke").update(
-            description="Number of radial spokes",
-            default=5,
-            min=3,
-            max=64
-        )
-        
-        empty["spider_spread_density_rib"] = self.config.density_rib
-        empty.id_properties_ui("spider_spread_density_rib").update(
-            description="Number of concentric ribs",
-            default=3,
-            min=1,
-            max=32
-        )
-        
-        empty["spider_spread_curvature"] = self.config.curvature
-        empty.id_properties_ui("spider_spread_curvature").update(
-            description="Curvature of web strands",
-            default=0.1,
-            min=0.0,
-            max=2.0
-        )
-        
-        empty["spider_spread_random_spread_edge"] = self.config.random_spread_edge
-        empty.id_properties_ui("spider_spread_random_spread_edge").update(
-            description="Random variation at web edges",
-            default=0.1,
-            min=0.0,
-            max=1.0
-        )
-        
-        empty["spider_spread_random_spread_interior"] = self.config.random_spread_interior
-        empty.id_properties_ui("spider_spread_random_spread_interior").update(
-            description="Random variation in web interior",
-            default=0.05,
-            min=0.0,
-            max=1.0
-        )
-        
-        # Store random values for consistency/reproducibility
-        self.store_random_values_on_empty(empty)
-    
+    @staticmethod
+    def random_pattern_key(config):
+        """The settings the random values depend on, cheapest to compare first"""
+        return [config.density_spoke, config.density_rib, config.random_spread_edge, config.random_spread_interior]
+
     def store_random_values_on_empty(self, empty):
         """Store the generated random values on the empty for consistency"""
-        # Store edge random offsets
-        for i, (x_offset, y_offset) in self.edge_random_offsets.items():
-            empty[f"spider_spread_edge_random_x_{i}"] = x_offset
-            empty[f"spider_spread_edge_random_y_{i}"] = y_offset
-        
-        # Store interior random offsets
-        for (spoke_i, rib_j), offset in self.interior_random_offsets.items():
-            empty[f"spider_spread_interior_random_{spoke_i}_{rib_j}"] = offset
+        # Settings the values were drawn for, so updates can check them with a single read
+        empty["spider_spread_random_pattern"] = self.random_pattern_key(self.config)
+        
+        # Store each set of offsets as one packed float64 buffer instead of a property per value
+        if self.edge_random_offsets is not None:
+            empty["spider_spread_edge_random"] = np.ascontiguousarray(self.edge_random_offsets, dtype=np.float64).tobytes()
+        if self.interior_random_offsets is not None:
+            empty["spider_spread_interior_random"] = np.ascontiguousarray(self.interior_random_offsets, dtype=np.float64).tobytes()
+        
+        # Drop the property per value older webs stored once the packed buffers replace it
+        legacy_prefixes = []
+        if self.edge_random_offsets is not None:
+            legacy_prefixes.append("spider_spread_edge_random_")
+        if self.interior_random_offsets is not None:
+            legacy_prefixes.append("spider_spread_interior_random_")
+        if legacy_prefixes:
+            for key in [key for key in empty.keys() if key.startswith(tuple(legacy_prefixes))]:
+                del empty[key]
     
-    @staticmethod
-    def load_config_from_empty(empty):
-        """Load the spread configuration from custom properties on the empty"""
+    # Settings older webs stored as one custom property each, before spider_web_config held them all
+    _LEGACY_FIELDS = ("radius", "height", "spread_time", "density_spoke", "density_rib",
+                      "curvature", "random_spread_edge", "random_spread_interior")
+    
+    @classmethod
+    def load_config_from_empty(cls, empty):
+        """Load the spread configuration from the custom properties older webs stored on the empty"""
         config = SpiderSpreadConfig()
         
-        if "spider_spread_radius" in empty:
-            config.radius = empty["spider_spread_radius"]
-        if "spider_spread_height" in empty:
-            config.height = empty["spider_spread_height"]
-        if "spider_spread_spread_time" in empty:
-            config.spread_time = empty["spider_spread_spread_time"]
-        if "spider_spread_density_spoke" in empty:
-            config.density_spoke = empty["spider_spread_density_spoke"]
-        if "spider_spread_density_rib" in empty:
-            config.density_rib = empty["spider_spread_density_rib"]
-        if "spider_spread_curvature" in empty:
-            config.curvature = empty["spider_spread_curvature"]
-        if "spider_spread_random_spread_edge" in empty:
-            config.random_spread_edge = empty["spider_spread_random_spread_edge"]
-        if "spider_spread_random_spread_interior" in empty:
-            config.random_spread_interior = empty["spider_spread_random_spread_interior"]
+        # One get() per property rather than a membership test followed by a lookup
+        for field_name in cls._LEGACY_FIELDS:
+            value = empty.get("spider_spread_" + field_name)
+            if value is not None:
+                setattr(config, field_name, value)
         
         return config
     
+    @classmethod
+    def clear_config_from_empty(cls, empty):
+        """Remove the custom properties older webs stored the spread configuration in"""
+        for field_name in cls._LEGACY_FIELDS:
+            empty.pop("spider_spread_" + field_name, None)
+    
     @staticmethod
     def load_random_values_from_empty(empty, density_spoke, density_rib):
-        """Load the stored random values from the empty"""
-        edge_random_offsets = {}
-        interior_random_offsets = {}
+        """Load the stored random values from the empty as (edge, interior) arrays, or None where missing"""
+        edge_shape = (density_spoke, 2)
+        interior_shape = (density_spoke, density_rib)
+        
+        # Packed buffers: one read and one copy each
+        edge_blob = empty.get("spider_spread_edge_random")
+        interior_blob = empty.get("spider_spread_interior_random")
+        if edge_blob is not None and interior_blob is not None:
+            edge_random_offsets = np.frombuffer(edge_blob, dtype=np.float64)
+            interior_random_offsets = np.frombuffer(interior_blob, dtype=np.float64)
+            if edge_random_offsets.size == 2 * density_spoke and interior_random_offsets.size == density_spoke * density_rib:
+                return edge_random_offsets.reshape(edge_shape), interior_random_offsets.reshape(interior_shape)
+            return None, None
+        
+        # Older webs stored a property per value, starting from index 0. Webs without any stored
+        # values would otherwise probe every spoke and rib key just to find nothing
+        if "spider_spread_edge_random_x_0" not in empty and "spider_spread_interior_random_0_0" not in empty:
+            return None, None
+        
+        edge_random_offsets = np.zeros(edge_shape)
+        interior_random_offsets = np.zeros(interior_shape)
+        found_edge = found_interior = False
         
-        # Load edge random offsets
         for i in range(density_spoke):
             x_key = f"spider_spread_edge_random_x_{i}"
             y_key = f"spider_spread_edge_random_y_{i}"
             if x_key in empty and y_key in empty:
                 edge_random_offsets[i] = (empty[x_key], empty[y_key])
+                found_edge = True
         
-        # Load interior random offsets
         for i in range(density_spoke):
             for j in range(density_rib):
                 key = f"spider_spread_interior_random_{i}_{j}"
                 if key in empty:
-                    interior_random_offsets[(i, j)] = empty[key]
+                    interior_random_offsets[i, j] = empty[key]
+                    found_interior = True
         
-        return edge_random_offsets, interior_random_offsets
+        return (
+            edge_random_offsets if found_edge else None,
+            interior_random_offsets if found_interior else None,
+        )
     
     def load_random_values_from_empty_instance(self, empty):
         """Load random values from empty into this instance"""
@@ -596,5 +661,7 @@ class SpiderSpread:
     
     def set_random_values(self, edge_random_offsets, interior_random_offsets):
         """Set the random values directly (for preserving values during updates)"""
-        self.edge_random_offsets = edge_random_offsets.copy() if edge_random_offsets else {}
-        self.interior_random_offsets = interior_random_offsets.copy() if interior_random_offsets else {}
\ No newline at end of file
+        # The offsets are only ever replaced, never written into, so arrays just loaded from the
+        # empty are kept as they are rather than copied again
+        self.edge_random_offsets = np.asarray(edge_random_offsets, dtype=np.float64) if edge_random_offsets is not None else None
+        self.interior_random_offsets = np.asarray(interior_random_offsets, dtype=np.float64) if interior_random_offsets is not None else None
\ No newline at end of file
@@ -1,4 +1,5 @@
 import bpy
+import json
 import math
 from dataclasses import dataclass, field
 from typing import Tuple, Optional
@@ -10,14 +11,16 @@ from .spider_spread import *
 
 class SpiderWeb:
     """A generated spider web and shot animated"""
+    __slots__ = ('origin', 'target', 'config', 'spider_shot', 'spider_spread', 'web_object')
+
     def __init__(self, origin: Tuple[float, float, float], target: Tuple[float, float, float], config: SpiderWebConfig = None):
         self.origin = origin
         self.target = target
         self.config = config or SpiderWebConfig()
         
         # Shot and Spread data and behaviors 
-        self.spider_shot = SpiderShot(origin, target, config.spider_shot_config if config else None)
-        self.spider_spread = SpiderSpread(origin, target, config.spider_spread_config if config else None)
+        self.spider_shot = SpiderShot(origin, target, self.config.spider_shot_config)
+        self.spider_spread = SpiderSpread(origin, target, self.config.spider_spread_config)
         
         # Blender Object
         self.web_object = None
@@ -33,6 +36,10 @@ class SpiderWeb:
         
         # Create target reference point as child of SpiderWeb
         target_empty = create_control_point(self.target, "WebTarget", spider_web_empty)
+        
+        # Link the web to its origin and target so the update operators can resolve them directly
+        spider_web_empty["spider_web_origin"] = origin_empty
+        spider_web_empty["spider_web_target"] = target_empty
 
         # Create spread points
         self.spider_spread.create_spread(origin_empty, target_empty)
@@ -41,35 +48,43 @@ class SpiderWeb:
         # Create projectile or tether first
         self.spider_shot.create_shot(context, origin_empty, target_empty, self.spider_spread.web_center)
 
-        # Animate Shot
         if self.config.animate_web:
-            self.spider_shot.animate_shot(context, origin_empty, target_empty, start_frame=self.config.start_frame)
+            start_frame = self.config.start_frame
+            
+            # Animate Shot
+            self.spider_shot.animate_shot(context, origin_empty, target_empty, start_frame=start_frame)
 
-        # Animate Web Spread (starting after shot completes)
-        if self.config.animate_web:
-            # Calculate when the spread should start (after shot completes)
+            # Animate Web Spread, starting once the shot completes
+            render = context.scene.render
+            fps = render.fps / render.fps_base
             shot_travel_time = self.config.spider_shot_config.shoot_time  # in seconds
-            spread_start_frame = self.config.start_frame + int(shot_travel_time * (context.scene.render.fps / context.scene.render.fps_base))
+            spread_start_frame = start_frame + int(shot_travel_time * fps)
             
             self.spider_spread.animate_spread(context, origin_empty, target_empty, spread_start_frame, self.config.spider_spread_config.spread_time)
 
         # Store all configurations on the spider web empty
-        self.spider_shot.store_config_on_empty(spider_web_empty)
-        self.spider_spread.store_config_on_empty(spider_web_empty)
-        self.store_config_on_empty(spider_web_empty)  # Store web-level config
+        self.spider_spread.store_random_values_on_empty(spider_web_empty)
+        self.store_config_on_empty(spider_web_empty)
+        self.store_components_on_empty(spider_web_empty)
+
+    def store_components_on_empty(self, empty):
+        """Store the names of the web's spread and shot objects, so updates can look them up directly"""
+        components = self.spider_spread.component_objects() + self.spider_shot.shot_objects()
+        empty["spider_web_components"] = [obj.name for obj in components]
 
     def store_config_on_empty(self, empty):
-        """Store the web-level configuration as custom properties on the empty"""
-        # Store web-level animation settings
-        empty["spider_web_animate_web"] = self.config.animate_web
-        empty.id_properties_ui("spider_web_animate_web").update(
-            description="Whether to animate the web creation",
-            default=True
+        """Store the whole web configuration on the empty"""
+        # Whole config packed into one property, the only place it is read back from
+        set_ui_property(
+            empty, "spider_web_config", json.dumps(self.config.to_dict()),
+            description="Whole web configuration as JSON, read back in one go when the web is updated"
         )
         
-        empty["spider_web_start_frame"] = self.config.start_frame
-        empty.id_properties_ui("spider_web_start_frame").update(
-            description="Frame to start the web animation",
-            default=1,
-            min=1
-        )
\ No newline at end of file
+        # Older webs stored a property per setting; drop them so they can't disagree with the JSON
+        SpiderShot.clear_config_from_empty(empty)
+        SpiderSpread.clear_config_from_empty(empty)
+        empty.pop("spider_web_animate_web", None)
+        empty.pop("spider_web_start_frame", None)
+        
+        # Positions the web was built for, so updates can tell when nothing has moved
+        empty["spider_web_built_positions"] = [*self.origin[:3], *self.target[:3]]
\ No newline at end of file
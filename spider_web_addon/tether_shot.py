@@ -1,7 +1,33 @@
 import bpy
+import numpy as np
 from typing import Tuple
-from mathutils import Vector
 from .config import SpiderShotConfig
+from .utils import get_shared_mesh, get_material, insert_keyframes
+
+def _tether_length(start_empty, end_empty):
+    """World-space distance between two empties, matching the tether's world-space constraints"""
+    # The empties are parented, so their locations are local; compare their world positions
+    return (end_empty.matrix_world.translation - start_empty.matrix_world.translation).length
+
+def _build_tether_material(name):
+    """Build the plain light gray tether material"""
+    material = bpy.data.materials.new(name=name)
+    # Set up a basic material (you can customize this)
+    material.use_nodes = True
+    nodes = material.node_tree.nodes
+    nodes.clear()
+    
+    # Add principled BSDF
+    bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
+    bsdf.inputs['Base Color'].default_value = (0.8, 0.8, 0.8, 1.0)  # Light gray
+    bsdf.inputs['Roughness'].default_value = 0.3
+    
+    # Add output node
+    output = nodes.new(type='ShaderNodeOutputMaterial')
+    
+    # Connect nodes
+    material.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
+    return material
 
 class TetherShot:
     """Handles tethered spider web shots"""
@@ -19,21 +45,9 @@ class TetherShot:
     def create_tether_mesh(self, context, origin_empty, web_center_empty):
         """Creates a rope tether connecting origin to web_center"""
         
-        # Create mesh data
-        mesh = bpy.data.meshes.new(name="SpiderTether")
-        
-        # Create vertices - just two points for a simple line
-        verts = [
-            (0.0, 0.0, 0.0),  # Origin point (local space)
-            (0.0, 0.0, 1.0)   # End point (will be positioned via constraints)
-        ]
-        
-        # Create edge connecting the two vertices
-        edges = [(0, 1)]
-        
-        # Create the mesh
-        mesh.from_pydata(verts, edges, [])
-        mesh.update()
+        # Tethers of the same width share one mesh; the skin radius lives on the mesh, so the
+        # width is part of the key
+        mesh = get_shared_mesh(("SpiderTether", self._tether_width()), self._build_tether_mesh)
         
         # Create mesh object
         tether_obj = bpy.data.objects.new("SpiderTether", mesh)
@@ -53,6 +67,33 @@ class TetherShot:
         
         return tether_obj
 
+    @staticmethod
+    def _build_tether_mesh():
+        """Build the unit line mesh that the tether object stretches along its Z axis"""
+        mesh = bpy.data.meshes.new(name="SpiderTether")
+        
+        # Create vertices - just two points for a simple line: the origin point (local space) and
+        # the end point (positioned via constraints)
+        verts = np.array(((0.0, 0.0, 0.0), (0.0, 0.0, 1.0)), dtype=np.float32)
+        
+        # Create edge connecting the two vertices
+        edges = np.array((0, 1), dtype=np.int32)
+        
+        # Fill the mesh with bulk foreach_set calls rather than from_pydata's per-element Python loops
+        mesh.vertices.add(len(verts))
+        mesh.vertices.foreach_set("co", verts.ravel())
+        mesh.edges.add(len(edges) // 2)
+        mesh.edges.foreach_set("vertices", edges)
+        mesh.update()
+        
+        # Assign the material here, once per shared mesh, so every tether using it inherits the slot
+        mesh.materials.append(get_material("SpiderTether_Material", _build_tether_material))
+        return mesh
+
+    def _tether_width(self):
+        """Tether width from the config, falling back to the stored default"""
+        return self.config.tether_width if self.config.tether_width is not None else 0.1
+
     def _setup_tether_constraints(self, tether_obj, origin_empty, web_center_empty):
         """Set up constraints to make the tether follow the origin and stretch to web_center"""
         
@@ -61,20 +102,15 @@ class TetherShot:
         copy_loc_constraint.target = origin_empty
         copy_loc_constraint.name = "Follow_Origin"
         
-        # Add a Track To constraint to point towards the web center
-        track_constraint = tether_obj.constraints.new(type='TRACK_TO')
+        # Add a Damped Track constraint to point towards the web center. The skinned line is round,
+        # so its roll doesn't matter and Track To's extra up-axis solve would be wasted every frame
+        track_constraint = tether_obj.constraints.new(type='DAMPED_TRACK')
         track_constraint.target = web_center_empty
         track_constraint.track_axis = 'TRACK_Z'
-        track_constraint.up_axis = 'UP_Y'
         track_constraint.name = "Point_To_Web_Center"
         
-        # Calculate initial distance for scaling
-        origin_pos = Vector(origin_empty.location)
-        target_pos = Vector(web_center_empty.location)
-        distance = (target_pos - origin_pos).length
-        
         # Scale the tether to match the distance
-        tether_obj.scale = (1.0, 1.0, distance)
+        tether_obj.scale = (1.0, 1.0, _tether_length(origin_empty, web_center_empty))
         
         # Store references for manual updates
         tether_obj["origin_empty"] = origin_empty
@@ -82,58 +118,31 @@ class TetherShot:
 
     def update_tether_length(self, tether_obj):
         """Manually update the tether length based on current positions"""
-        if not tether_obj or "origin_empty" not in tether_obj or "web_center_empty" not in tether_obj:
+        if not tether_obj:
             return
         
-        origin_empty = tether_obj["origin_empty"]
-        web_center_empty = tether_obj["web_center_empty"]
+        # One lookup per stored reference; a missing one reads as None
+        origin_empty = tether_obj.get("origin_empty")
+        web_center_empty = tether_obj.get("web_center_empty")
         
         if origin_empty and web_center_empty:
-            origin_pos = Vector(origin_empty.location)
-            target_pos = Vector(web_center_empty.location)
-            distance = (target_pos - origin_pos).length
-            
             # Update the Z scale to match the distance
-            tether_obj.scale = (1.0, 1.0, distance)
+            tether_obj.scale = (1.0, 1.0, _tether_length(origin_empty, web_center_empty))
 
     def _apply_tether_styling(self, tether_obj):
-        """Apply visual styling to the tether"""
-        
-        # Create or get tether material
-        mat_name = "SpiderTether_Material"
-        if mat_name in bpy.data.materials:
-            material = bpy.data.materials[mat_name]
-        else:
-            material = bpy.data.materials.new(name=mat_name)
-            # Set up a basic material (you can customize this)
-            material.use_nodes = True
-            nodes = material.node_tree.nodes
-            nodes.clear()
-            
-            # Add principled BSDF
-            bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-            bsdf.inputs['Base Color'].default_value = (0.8, 0.8, 0.8, 1.0)  # Light gray
-            bsdf.inputs['Roughness'].default_value = 0.3
-            
-            # Add output node
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            
-            # Connect nodes
-            material.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-        
-        # Assign material to tether
-        tether_obj.data.materials.append(material)
+        """Apply visual styling to the tether (its material comes with the shared mesh)"""
         
         # For mesh thickness, we could use a Skin modifier or Solidify modifier
         # Adding a Skin modifier to give the edge thickness
-        tether_width = self.config.tether_width if self.config.tether_width is not None else 0.1
+        tether_width = self._tether_width()
         
         skin_modifier = tether_obj.modifiers.new(name="Skin", type='SKIN')
         
-        # Set the skin radius for both vertices
-        if tether_obj.data.skin_vertices:
-            for sv in tether_obj.data.skin_vertices[0].data:
-                sv.radius = (tether_width / 2, tether_width / 2)
+        # Set the skin radius for every vertex in one write
+        skin_vertices = tether_obj.data.skin_vertices
+        if skin_vertices:
+            skin_data = skin_vertices[0].data
+            skin_data.foreach_set("radius", np.full(len(skin_data) * 2, tether_width / 2, dtype=np.float32))
 
     def animate_shot(self, context, origin_empty, target_empty, start_frame=1):
         """Animate the tether shot"""
@@ -148,33 +157,23 @@ class TetherShot:
         tether_obj = self.tether_mesh
         
         # Clear existing animation data
-        if tether_obj.animation_data:
+        if tether_obj.animation_data is not None:
             tether_obj.animation_data_clear()
         
         # Convert shoot_time from seconds to frames
-        scene = context.scene
-        fps = scene.render.fps / scene.render.fps_base
-        duration_frames = int(self.config.shoot_time * fps)
-        end_frame = start_frame + duration_frames
-        
-        # Start with tether invisible (scale to 0)
-        tether_obj.scale = (1.0, 1.0, 0.0)
-        tether_obj.keyframe_insert(data_path="scale", frame=start_frame)
-        
-        # Calculate final distance for scaling
-        origin_pos = Vector(origin_empty.location)
-        target_pos = Vector(target_empty.location)
-        distance = (target_pos - origin_pos).length
-        
-        # Animate tether growing to full length
-        tether_obj.scale = (1.0, 1.0, distance)
-        tether_obj.keyframe_insert(data_path="scale", frame=end_frame)
-        
-        # Set up interpolation for smooth growth
-        if tether_obj.animation_data and tether_obj.animation_data.action:
-            for fcurve in tether_obj.animation_data.action.fcurves:
-                for keyframe in fcurve.keyframe_points:
-                    keyframe.interpolation = 'LINEAR'
+        render = context.scene.render
+        fps = render.fps / render.fps_base
+        end_frame = start_frame + int(self.config.shoot_time * fps)
+        
+        # Key the tether growing from invisible (scale 0) to full length, LINEAR for smooth growth,
+        # leaving it at full length
+        length = _tether_length(origin_empty, target_empty)
+        tether_obj.scale = (1.0, 1.0, length)
+        insert_keyframes(
+            tether_obj, "scale", (start_frame, end_frame),
+            ((1.0, 1.0, 0.0), (1.0, 1.0, length)),
+            interpolation='LINEAR'
+        )
         
         # Animate tether slack effect (optional)
         if self.config.tether_slack and self.config.tether_slack > 0:
@@ -190,15 +189,11 @@ class TetherShot:
         slack_frames = int(slack_duration_seconds * fps)
         slack_end_frame = end_frame + slack_frames
         
-        # Initial rotation (straight)
-        tether_obj.rotation_euler = (0, 0, 0)
-        tether_obj.keyframe_insert(data_path="rotation_euler", frame=end_frame)
-        
-        # Add slight bend for slack
+        # Straight, a slight bend for slack, then straight again, keyed in one batch
         slack_amount = self.config.tether_slack * 0.5  # Convert to radians
-        tether_obj.rotation_euler = (slack_amount, 0, 0)
-        tether_obj.keyframe_insert(data_path="rotation_euler", frame=end_frame + slack_frames // 2)
-        
-        # Return to straight
         tether_obj.rotation_euler = (0, 0, 0)
-        tether_obj.keyframe_insert(data_path="rotation_euler", frame=slack_end_frame)
\ No newline at end of file
+        insert_keyframes(
+            tether_obj, "rotation_euler",
+            (end_frame, end_frame + slack_frames // 2, slack_end_frame),
+            ((0, 0, 0), (slack_amount, 0, 0), (0, 0, 0))
+        )
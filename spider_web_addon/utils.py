@@ -1,33 +1,216 @@
 import bpy
 import math
+import numpy as np
+from functools import lru_cache
 from dataclasses import dataclass, field
 from typing import Tuple, Optional
 from mathutils import Vector, Matrix
 
-def create_control_point(location, name, parent=None):
-    bpy.ops.object.empty_add(type='SPHERE', location=location)
-    empty = bpy.context.active_object
-    empty.name = name
+__all__ = ['get_parent_inverse', 'create_control_point', 'get_point_offset_from_end', 'insert_keyframes', 'set_ui_property', 'get_shared_mesh',
+           'get_material', 'unit_uv_sphere', 'unit_cylinder', 'new_mesh']
+
+def get_parent_inverse(parent):
+    """Inverse of the parent's world matrix, computed analytically when it is a pure translation"""
+    parent_world = parent.matrix_world
+    if parent_world.to_3x3().is_identity:
+        return Matrix.Translation(-parent_world.translation)
+    return parent_world.inverted()
+
+def create_control_point(location, name, parent=None, parent_inverse=None, link=True):
+    # Build the empty directly through bpy.data, avoiding the operator's
+    # context/depsgraph update and active-object shuffling on every call
+    empty = bpy.data.objects.new(name, None)
+    empty.empty_display_type = 'SPHERE'
     empty.empty_display_size = 0.05
     
+    # Callers building many points at once can skip linking and link them together afterwards
+    if link:
+        bpy.context.collection.objects.link(empty)
+    
+    # Write the world matrix directly so children parented below can read an
+    # up-to-date matrix_world without waiting for a depsgraph evaluation
+    empty.matrix_world = Matrix.Translation(location)
+    
     if parent is not None:
         empty.parent = parent
         empty.parent_type = 'OBJECT'
-        empty.matrix_parent_inverse = parent.matrix_world.inverted()
+        # Callers creating many children of one parent can pass its inverse in once
+        if parent_inverse is None:
+            parent_inverse = get_parent_inverse(parent)
+        empty.matrix_parent_inverse = parent_inverse
     
     return empty
 
-def get_point_offset_from_end(start, end, distance_from_end):
-    start_vec = Vector(start)
-    end_vec = Vector(end)
+def set_ui_property(owner, key, value, **ui_data):
+    """Set a custom property, adding its UI metadata (description, default, limits) only when it is new"""
+    # Updates rewrite every stored setting; the metadata doesn't change, so only its first write pays for it
+    is_new = key not in owner
+    owner[key] = value
+    if is_new:
+        owner.id_properties_ui(key).update(**ui_data)
+
+# Shared meshes and materials are found again by name on every call: a stored datablock
+# reference could point at freed memory after undo. Mesh names by build key:
+_shared_mesh_names = {}
+
+def get_shared_mesh(key, build):
+    """Return the mesh built for key, calling build() only when no earlier one still exists.
     
-    direction = end_vec - start_vec
-    line_length = direction.length
+    Shots with the same settings link their objects to one mesh instead of each building a copy.
+    The mesh is tagged with its key so a renamed or replaced datablock is never mistaken for it.
+    """
+    key_tag = repr(key)
+    name = _shared_mesh_names.get(key)
+    mesh = bpy.data.meshes.get(name) if name is not None else None
+    if mesh is None or mesh.get("spider_shared_mesh_key") != key_tag:
+        mesh = build()
+        mesh["spider_shared_mesh_key"] = key_tag
+        _shared_mesh_names[key] = mesh.name
+    return mesh
+
+def get_material(name, build):
+    """Return the material called name, calling build(name) to create it only when it doesn't exist"""
+    material = bpy.data.materials.get(name)
+    if material is None:
+        material = build(name)
+    return material
+
+def get_point_offset_from_end(start, end, distance_from_end):
+    dx = end[0] - start[0]
+    dy = end[1] - start[1]
+    dz = end[2] - start[2]
+    line_length = math.sqrt(dx * dx + dy * dy + dz * dz)
     
     if distance_from_end >= line_length:
-        return start_vec
+        return Vector(start)
     if distance_from_end <= 0:
-        return end_vec
+        return Vector(end)
+    
+    t = distance_from_end / line_length
+    return Vector((end[0] - dx * t, end[1] - dy * t, end[2] - dz * t))
+
+# Keyframe interpolation enum values by identifier, for writing them with foreach_set
+_INTERPOLATION_VALUES = {
+    item.identifier: item.value
+    for item in bpy.types.Keyframe.bl_rna.properties["interpolation"].enum_items
+}
+
+def insert_keyframes(obj, data_path, frames, values, group_name="Object Transforms", interpolation=None):
+    """Key every channel of obj's data_path at all frames at once.
+    
+    values holds one row per frame with one column per channel. Each F-Curve is created once and
+    filled through a single keyframe_points.add() and foreach_set(), instead of a keyframe_insert()
+    per frame that sets the property and updates the curve every time. The curves must not have
+    keys yet; callers key freshly created objects or clear their animation first. When
+    interpolation is given, every key is set to it.
+    """
+    anim_data = obj.animation_data or obj.animation_data_create()
+    if anim_data.action is None:
+        anim_data.action = bpy.data.actions.new(obj.name + "Action")
+    action = anim_data.action
+    
+    frames = np.asarray(frames, dtype=np.float32)
+    values = np.asarray(values, dtype=np.float32).reshape(len(frames), -1)
+    
+    # Like keyframe_insert(), a later key on the same frame replaces the earlier one
+    _, last_of_frame = np.unique(frames[::-1], return_index=True)
+    frames = frames[::-1][last_of_frame]
+    values = values[::-1][last_of_frame]
+    
+    co = np.empty((len(frames), 2), dtype=np.float32)
+    co[:, 0] = frames
+    if interpolation is not None:
+        interpolation_values = np.full(len(frames), _INTERPOLATION_VALUES[interpolation], dtype=np.int32)
+    
+    for index in range(values.shape[1]):
+        fcurve = action.fcurve_ensure_for_datablock(obj, data_path, index=index, group_name=group_name)
+        keyframe_points = fcurve.keyframe_points
+        
+        # Writing only co would leave existing keys' handles and interpolation on the wrong frames
+        if len(keyframe_points):
+            raise ValueError(f"{obj.name}: {data_path}[{index}] already has keyframes")
+        
+        co[:, 1] = values[:, index]
+        keyframe_points.add(len(co))
+        keyframe_points.foreach_set("co", co.ravel())
+        if interpolation is not None:
+            keyframe_points.foreach_set("interpolation", interpolation_values)
+        
+        # Recalculate the auto handles once for the whole curve
+        fcurve.update()
+
+@lru_cache(maxsize=None)
+def unit_uv_sphere(segments=32, rings=16):
+    """Vertices and faces of a radius 1 UV sphere, laid out like primitive_uv_sphere_add's.
+    
+    Returns (co, loop_totals, vertex_indices) as arrays ready for foreach_set. Cached per resolution,
+    so the arrays are shared and must not be written to.
+    """
+    # Top pole, the rings between the poles from top to bottom, then the bottom pole
+    ring_angles = math.pi * np.arange(1, rings) / rings
+    segment_angles = 2 * math.pi * np.arange(segments) / segments
+    ring_co = np.empty((rings - 1, segments, 3), dtype=np.float32)
+    ring_co[..., 0] = np.sin(ring_angles)[:, None] * np.cos(segment_angles)
+    ring_co[..., 1] = np.sin(ring_angles)[:, None] * np.sin(segment_angles)
+    ring_co[..., 2] = np.cos(ring_angles)[:, None]
+    co = np.concatenate(([(0.0, 0.0, 1.0)], ring_co.reshape(-1, 3), [(0.0, 0.0, -1.0)])).astype(np.float32)
+    
+    top_pole = 0
+    bottom_pole = len(co) - 1
+    ring_index = 1 + np.arange((rings - 1) * segments).reshape(rings - 1, segments)
+    next_ring_index = np.roll(ring_index, -1, axis=1)
+    
+    # Triangle fans at the poles and quads between neighbouring rings, all wound to face outwards
+    top_fan = np.stack((np.full(segments, top_pole), ring_index[0], next_ring_index[0]), axis=1)
+    quads = np.stack((ring_index[:-1], ring_index[1:], next_ring_index[1:], next_ring_index[:-1]), axis=2).reshape(-1, 4)
+    bottom_fan = np.stack((ring_index[-1], np.full(segments, bottom_pole), next_ring_index[-1]), axis=1)
+    
+    loop_totals = np.concatenate((np.full(segments, 3), np.full(len(quads), 4), np.full(segments, 3))).astype(np.int32)
+    vertex_indices = np.concatenate((top_fan.ravel(), quads.ravel(), bottom_fan.ravel())).astype(np.int32)
+    return co, loop_totals, vertex_indices
+
+@lru_cache(maxsize=None)
+def unit_cylinder(vertices=32):
+    """Vertices and faces of a radius 1, depth 2 cylinder with n-gon caps, like primitive_cylinder_add's.
+    
+    Returns (co, loop_totals, vertex_indices) as arrays ready for foreach_set. Cached per resolution,
+    so the arrays are shared and must not be written to.
+    """
+    angles = 2 * math.pi * np.arange(vertices) / vertices
+    co = np.empty((2, vertices, 3), dtype=np.float32)
+    co[..., 0] = np.cos(angles)
+    co[..., 1] = np.sin(angles)
+    co[0, :, 2] = -1.0
+    co[1, :, 2] = 1.0
+    
+    bottom = np.arange(vertices)
+    top = bottom + vertices
+    
+    # Side quads, then the top cap and the reversed bottom cap so every face points outwards
+    sides = np.stack((bottom, np.roll(bottom, -1), np.roll(top, -1), top), axis=1)
+    loop_totals = np.concatenate((np.full(vertices, 4), (vertices, vertices))).astype(np.int32)
+    vertex_indices = np.concatenate((sides.ravel(), top, bottom[::-1])).astype(np.int32)
+    return co.reshape(-1, 3), loop_totals, vertex_indices
+
+def new_mesh(name, co, loop_totals, vertex_indices, material=None):
+    """Build a mesh datablock from vertex and face arrays with bulk foreach_set calls"""
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(co, dtype=np.float32).ravel())
+    
+    loop_starts = np.zeros(len(loop_totals), dtype=np.int32)
+    np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+    mesh.loops.add(len(vertex_indices))
+    mesh.loops.foreach_set("vertex_index", vertex_indices)
+    mesh.polygons.add(len(loop_totals))
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    mesh.polygons.foreach_set("loop_total", loop_totals)
+    
+    # Derive the edges from the faces and validate the result in one pass
+    mesh.update(calc_edges=True)
+    mesh.validate()
     
-    direction.normalize()
-    return end_vec - direction * distance_from_end
\ No newline at end of file
+    # The material goes on the mesh once, so every object sharing it inherits the slot
+    if material is not None:
+        mesh.materials.append(material)
+    return mesh